@@ -22,6 +22,24 @@ else:
         USE_CYTHON = False
         print("Cython not found. Building from C sources if available.", file=sys.stderr)
 
+# -march=native ties the binary to the build machine's CPU, so only use it
+# for local builds that ask for it (wheels must stay portable).
+USE_NATIVE_ARCH = os.environ.get("W4GNS_NATIVE", "0") == "1"
+
+if os.name == "nt":
+    EXTRA_COMPILE_ARGS = ["/O2", "/GL"]
+    EXTRA_LINK_ARGS = ["/LTCG"]
+else:
+    EXTRA_COMPILE_ARGS = [
+        "-O3",
+        "-funroll-loops",
+        "-flto",
+        "-fno-semantic-interposition",
+    ]
+    if USE_NATIVE_ARCH:
+        EXTRA_COMPILE_ARGS.append("-march=native")
+    EXTRA_LINK_ARGS = ["-flto"]
+
 # Define extension modules
 ext_modules = []
 
@@ -32,7 +50,8 @@ if USE_CYTHON:
             "w4gns_logger_ai.c_extensions.c_adif_parser",
             sources=["w4gns_logger_ai/c_extensions/c_adif_parser.pyx"],
             language="c",
-            extra_compile_args=["-O3", "-march=native"] if os.name != "nt" else ["/O2"],
+            extra_compile_args=EXTRA_COMPILE_ARGS,
+            extra_link_args=EXTRA_LINK_ARGS,
         )
     )
 
@@ -42,7 +61,8 @@ if USE_CYTHON:
             "w4gns_logger_ai.c_extensions.c_awards",
             sources=["w4gns_logger_ai/c_extensions/c_awards.pyx"],
             language="c",
-            extra_compile_args=["-O3", "-march=native"] if os.name != "nt" else ["/O2"],
+            extra_compile_args=EXTRA_COMPILE_ARGS,
+            extra_link_args=EXTRA_LINK_ARGS,
         )
     )
 
@@ -52,7 +72,8 @@ if USE_CYTHON:
             "w4gns_logger_ai.c_extensions.c_adif_export",
             sources=["w4gns_logger_ai/c_extensions/c_adif_export.pyx"],
             language="c",
-            extra_compile_args=["-O3", "-march=native"] if os.name != "nt" else ["/O2"],
+            extra_compile_args=EXTRA_COMPILE_ARGS,
+            extra_link_args=EXTRA_LINK_ARGS,
         )
     )
 
@@ -84,9 +105,8 @@ else:
                     module_name,
                     sources=[c_source],
                     language="c",
-                    extra_compile_args=["-O3", "-march=native"]
-                    if os.name != "nt"
-                    else ["/O2"],
+                    extra_compile_args=EXTRA_COMPILE_ARGS,
+                    extra_link_args=EXTRA_LINK_ARGS,
                 )
             )
 
@@ -24,27 +24,40 @@ def sample_qso():
     )
 
 
+@pytest.fixture(scope="session")
+def _template_db(tmp_path_factory):
+    """Create the schema once in a template database file for the session.
+
+    The template's engine is disposed right away so the last connection
+    checkpoints the WAL and the file on disk is complete for copying.
+    """
+    from w4gns_logger_ai import storage
+
+    db_path = tmp_path_factory.mktemp("tpl") / "template.sqlite3"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(storage.DB_ENV_VAR, str(db_path))
+        storage.create_db_and_tables()
+        storage.reset_engine_cache()
+    return db_path
+
+
 @pytest.fixture
-def temp_db(tmp_path):
-    """Create a temporary database for testing."""
-    import os
+def temp_db(_template_db, tmp_path):
+    """Provide an empty temporary database for testing.
 
-    # Store original value if it exists
-    original_db_path = os.environ.get("W4GNS_DB_PATH")
+    Each test gets its own copy of the template file (SQLite databases are
+    self-contained), which is cheaper than re-running the DDL per test.
+    """
+    import shutil
 
-    # Set temporary database path
-    db_path = tmp_path / "test.sqlite3"
-    os.environ["W4GNS_DB_PATH"] = str(db_path)
+    from w4gns_logger_ai import storage
 
-    try:
-        from w4gns_logger_ai.storage import create_db_and_tables
-        create_db_and_tables()
+    db_path = tmp_path / "test.sqlite3"
+    shutil.copyfile(_template_db, db_path)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(storage.DB_ENV_VAR, str(db_path))
+        mp.setenv(storage.SQLITE_FAST_ENV_VAR, "1")
 
         yield db_path
 
-    finally:
-        # Cleanup - restore original value or remove if it wasn't set
-        if original_db_path:
-            os.environ["W4GNS_DB_PATH"] = original_db_path
-        elif "W4GNS_DB_PATH" in os.environ:
-            del os.environ["W4GNS_DB_PATH"]
+        storage.reset_engine_cache()
@@ -74,3 +74,24 @@ def test_malformed_config_fallback(tmp_path, monkeypatch):
         # Cleanup
         if 'w4gns_logger_ai.awards' in sys.modules:
             del sys.modules['w4gns_logger_ai.awards']
+
+
+def test_thresholds_reload_after_edit(tmp_path, monkeypatch):
+    """Cached thresholds are re-read once the config file changes."""
+    import os
+
+    config_path = tmp_path / "awards.json"
+    config_path.write_text(json.dumps({"DXCC": 120}))
+    monkeypatch.setenv("W4GNS_AWARDS_CONFIG", str(config_path))
+
+    first = get_award_thresholds()
+    assert first["DXCC"] == 120
+
+    # Returned dicts are copies, so mutating one must not leak into the cache
+    first["DXCC"] = 1
+    assert get_award_thresholds()["DXCC"] == 120
+
+    config_path.write_text(json.dumps({"DXCC": 130}))
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get_award_thresholds()["DXCC"] == 130
@@ -0,0 +1,33 @@
+import pytest
+
+from w4gns_logger_ai import parallel_utils
+from w4gns_logger_ai.parallel_utils import get_optimal_workers
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def eight_cores(monkeypatch):
+    """Pretend to be a non-CI machine with 8 physical / 16 logical cores."""
+    monkeypatch.setattr(parallel_utils, "is_ci_environment", lambda: False)
+    monkeypatch.setattr(parallel_utils, "_cpu_counts", lambda: (8, 16))
+
+
+def test_memory_caps_workers(eight_cores, monkeypatch):
+    """Available memory / bytes per worker caps the CPU-based count."""
+    monkeypatch.setattr(parallel_utils, "_available_memory", lambda: 300 * MB)
+    assert get_optimal_workers("cpu") == 8
+    assert get_optimal_workers("cpu", estimated_bytes_per_worker=100 * MB) == 3
+    assert get_optimal_workers("cpu", estimated_bytes_per_worker=10 * MB) == 8
+
+
+def test_unknown_memory_leaves_workers_uncapped(eight_cores, monkeypatch):
+    """Without a memory reading the estimate is ignored."""
+    monkeypatch.setattr(parallel_utils, "_available_memory", lambda: None)
+    assert get_optimal_workers("cpu", estimated_bytes_per_worker=100 * MB) == 8
+
+
+def test_memory_cap_floors_at_one_worker(eight_cores, monkeypatch):
+    """Even when one worker would not fit, at least one is returned."""
+    monkeypatch.setattr(parallel_utils, "_available_memory", lambda: 10 * MB)
+    assert get_optimal_workers("cpu", estimated_bytes_per_worker=100 * MB) == 1
@@ -1,286 +1,508 @@
+import threading
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
 
 from w4gns_logger_ai.models import QSO
 from w4gns_logger_ai.storage import (
+    CallMatch,
     add_qso,
     bulk_add_qsos,
-    create_db_and_tables,
+    bulk_add_qsos_parallel,
+    count_qsos,
     delete_qso,
+    delete_qsos,
     find_qso_by_frequency,
     get_first_qso_by_call,
     get_qso,
+    get_qsos,
+    list_qso_columns,
+    list_qso_rows_stream,
     list_qsos,
+    list_qsos_filtered,
     list_qsos_stream,
+    qso_log_stamp,
     search_qsos,
     search_qsos_stream,
+    session_scope,
 )
 
 
-def test_storage_basic_crud(tmp_path):
+def test_storage_basic_crud(temp_db):
     """Test basic CRUD operations."""
-    import os
-    # Use temporary database for testing
-    original_db_path = os.environ.get("W4GNS_DB_PATH")
-    os.environ["W4GNS_DB_PATH"] = str(tmp_path / "test.sqlite3")
-
-    try:
-        # Create tables
-        create_db_and_tables()
-
-        # Test adding a QSO
-        from datetime import datetime
+    # Test adding a QSO
+    qso = QSO(
+        call="K1ABC",
+        start_at=datetime(2024, 7, 4, 12, 0, 0),
+        band="20m",
+        mode="SSB"
+    )
+
+    saved_qso = add_qso(qso)
+    assert saved_qso.id is not None
+    assert saved_qso.call == "K1ABC"
+
+    # Test retrieving the QSO
+    retrieved = get_qso(saved_qso.id)
+    assert retrieved is not None
+    assert retrieved.call == "K1ABC"
+
+    # Test listing QSOs
+    qsos = list_qsos(limit=10)
+    assert len(qsos) == 1
+    assert qsos[0].call == "K1ABC"
+
+    # Test searching QSOs
+    results = search_qsos(call="K1ABC")
+    assert len(results) == 1
+    assert results[0].call == "K1ABC"
+
+    # Test deleting the QSO
+    deleted = delete_qso(saved_qso.id)
+    assert deleted is True
+
+    # Verify deletion
+    retrieved = get_qso(saved_qso.id)
+    assert retrieved is None
+
+
+def test_bulk_operations(temp_db):
+    """Test bulk operations."""
+    # Create multiple QSOs
+    qsos = []
+    for i in range(10):
         qso = QSO(
-            call="K1ABC",
-            start_at=datetime(2024, 7, 4, 12, 0, 0),
+            call=f"K1ABC{i}",
+            start_at=datetime(2024, 7, 4, 12, i, 0),
             band="20m",
             mode="SSB"
         )
+        qsos.append(qso)
 
-        saved_qso = add_qso(qso)
-        assert saved_qso.id is not None
-        assert saved_qso.call == "K1ABC"
+    # Batched insert path
+    count = bulk_add_qsos_parallel(qsos, batch_size=5)
+    assert count == 10
 
-        # Test retrieving the QSO
-        retrieved = get_qso(saved_qso.id)
-        assert retrieved is not None
-        assert retrieved.call == "K1ABC"
+    # Verify they were added
+    all_qsos = list_qsos(limit=20)
+    assert len(all_qsos) == 10
 
-        # Test listing QSOs
-        qsos = list_qsos(limit=10)
-        assert len(qsos) == 1
-        assert qsos[0].call == "K1ABC"
+    # Single-transaction insert path
+    more = [
+        QSO(call=f"W1XYZ{i}", start_at=datetime(2024, 7, 5, 12, i, 0))
+        for i in range(5)
+    ]
+    assert bulk_add_qsos(more) == 5
+    assert len(list_qsos(limit=20)) == 15
 
-        # Test searching QSOs
-        results = search_qsos(call="K1ABC")
-        assert len(results) == 1
-        assert results[0].call == "K1ABC"
+def test_next_function_helpers(temp_db):
+    """Test new helper functions using next() for efficient queries."""
+    # Add test QSOs
+    add_qso(
+        QSO(
+            call="W1ABC",
+            start_at=datetime(2024, 1, 1, 10, 0, 0),
+            band="20m",
+            mode="SSB",
+            freq_mhz=14.250,
+        )
+    )
+    add_qso(
+        QSO(
+            call="K2XYZ",
+            start_at=datetime(2024, 1, 2, 11, 0, 0),
+            band="40m",
+            mode="CW",
+            freq_mhz=7.050,
+        )
+    )
+    add_qso(
+        QSO(
+            call="W1DEF",
+            start_at=datetime(2024, 1, 3, 12, 0, 0),
+            band="20m",
+            mode="FT8",
+            freq_mhz=14.074,
+        )
+    )
 
-        # Test deleting the QSO
-        deleted = delete_qso(saved_qso.id)
-        assert deleted is True
+    # Test get_first_qso_by_call - finds first W1 callsign
+    result = get_first_qso_by_call("W1")
+    assert result is not None
+    # Should get most recent W1 (W1DEF is later than W1ABC)
+    assert result.call == "W1DEF"
 
-        # Verify deletion
-        retrieved = get_qso(saved_qso.id)
-        assert retrieved is None
+    # Test with exact call
+    result = get_first_qso_by_call("K2XYZ")
+    assert result is not None
+    assert result.call == "K2XYZ"
 
-    finally:
-        # Cleanup environment
-        if original_db_path:
-            os.environ["W4GNS_DB_PATH"] = original_db_path
-        elif "W4GNS_DB_PATH" in os.environ:
-            del os.environ["W4GNS_DB_PATH"]
+    # Test with non-existent call
+    result = get_first_qso_by_call("ZZ9ZZZ")
+    assert result is None
 
+    # Test find_qso_by_frequency
+    result = find_qso_by_frequency(14.250, tolerance=0.001)
+    assert result is not None
+    assert result.call == "W1ABC"
+    assert result.freq_mhz == 14.250
 
-def test_bulk_operations(tmp_path):
-    """Test bulk operations."""
-    import os
-    from datetime import datetime
+    # Test with broader tolerance
+    result = find_qso_by_frequency(14.000, tolerance=0.100)
+    assert result is not None
+    # Should find W1DEF at 14.074 (most recent within range)
+    assert result.call == "W1DEF"
 
-    # Use temporary database for testing
-    original_db_path = os.environ.get("W4GNS_DB_PATH")
-    os.environ["W4GNS_DB_PATH"] = str(tmp_path / "test_bulk.sqlite3")
+    # Test with frequency not in database
+    result = find_qso_by_frequency(21.000, tolerance=0.001)
+    assert result is None
 
-    try:
-        # Create tables
-        create_db_and_tables()
-
-        # Create multiple QSOs
-        qsos = []
-        for i in range(10):
-            qso = QSO(
-                call=f"K1ABC{i}",
-                start_at=datetime(2024, 7, 4, 12, i, 0),
-                band="20m",
-                mode="SSB"
+
+def test_streaming_functions(temp_db):
+    """Test generator-based streaming functions for memory efficiency."""
+    # Add test QSOs - use unique calls
+    for i in range(20):
+        add_qso(
+            QSO(
+                call=f"W{i % 3}STREAM",  # W0STREAM, W1STREAM, W2STREAM repeating
+                start_at=datetime(2024, 1, i + 1, 12, 0, 0),
+                band="20m" if i % 2 == 0 else "40m",
+                mode="SSB" if i % 3 == 0 else "CW",
+                freq_mhz=14.0 + i * 0.1,
             )
-            qsos.append(qso)
-
-        # Test bulk add - use regular bulk_add_qsos in CI for reliability
-        import os
-        is_ci = any(env in os.environ for env in ['CI', 'GITHUB_ACTIONS'])
-
-        if is_ci:
-            # Use regular bulk_add_qsos in CI to avoid parallel processing issues
-            count = bulk_add_qsos(qsos)
-        else:
-            # Test parallel bulk operations in local development
-            try:
-                from w4gns_logger_ai.storage import bulk_add_qsos_parallel
-                count = bulk_add_qsos_parallel(qsos, batch_size=5)
-            except (ImportError, Exception):
-                # Fallback to regular bulk add
-                count = bulk_add_qsos(qsos)
-
-        assert count == 10
-
-        # Verify they were added
-        all_qsos = list_qsos(limit=20)
-        assert len(all_qsos) == 10
+        )
 
-    finally:
-        # Cleanup environment
-        if original_db_path:
-            os.environ["W4GNS_DB_PATH"] = original_db_path
-        elif "W4GNS_DB_PATH" in os.environ:
-            del os.environ["W4GNS_DB_PATH"]
+    # Test list_qsos_stream - should yield items one at a time
+    stream_count = 0
+    for qso in list_qsos_stream(limit=10):
+        assert "STREAM" in qso.call
+        stream_count += 1
+    assert stream_count == 10
+
+    # Test search_qsos_stream - filter by band
+    band_count = 0
+    for qso in search_qsos_stream(band="20m", limit=20):
+        assert qso.band == "20m"
+        band_count += 1
+    assert band_count == 10  # Half are 20m
+
+    # Test search_qsos_stream - filter by call
+    call_count = 0
+    for qso in search_qsos_stream(call="W1", limit=20):
+        assert "W1" in qso.call
+        call_count += 1
+    # Should match W1STREAM entries
+    assert call_count > 0
+
+    # Test streaming with early termination (generator efficiency)
+    first_five = []
+    for i, qso in enumerate(list_qsos_stream(limit=100)):
+        first_five.append(qso)
+        if i >= 4:  # Stop after 5
+            break
+    assert len(first_five) == 5
+
+    # Verify streaming uses less memory than list
+    stream_result = list_qsos_stream(limit=5)
+    assert hasattr(stream_result, "__iter__")
+    assert hasattr(stream_result, "__next__")
+
+
+def test_sqlite_fast_pragmas(temp_db):
+    """W4GNS_SQLITE_FAST=1 (set by the test DB fixture) switches to WAL."""
+    with session_scope() as session:
+        mode = session.execute(text("PRAGMA journal_mode")).scalar()
+        sync = session.execute(text("PRAGMA synchronous")).scalar()
+    assert mode == "wal"
+    assert sync == 1  # NORMAL
+
+
+def test_sqlite_wal_by_default(tmp_path, monkeypatch):
+    """Without W4GNS_SQLITE_FAST the database is WAL but keeps synchronous=FULL."""
+    from w4gns_logger_ai import storage
 
+    monkeypatch.setenv(storage.DB_ENV_VAR, str(tmp_path / "default.sqlite3"))
+    monkeypatch.delenv(storage.SQLITE_FAST_ENV_VAR, raising=False)
+    try:
+        storage.create_db_and_tables()
+        with session_scope() as session:
+            mode = session.execute(text("PRAGMA journal_mode")).scalar()
+            sync = session.execute(text("PRAGMA synchronous")).scalar()
+    finally:
+        storage.reset_engine_cache()
+    assert mode == "wal"
+    assert sync == 2  # FULL
+
+
+def test_list_qsos_filtered_matches_python_filter(temp_db):
+    """SQL band/mode filtering agrees with awards.filtered_qsos over recent QSOs."""
+    from w4gns_logger_ai.awards import filtered_qsos
+
+    bands = ["20m", " 20M ", "40m", None, "20m\t"]
+    modes = ["ssb", "CW", "FT8", None, "ssb\n"]
+    qsos = [
+        QSO(
+            call=f"K{i}ABC",
+            start_at=datetime(2024, 1, 1, 0, i),
+            band=bands[i % 5],
+            mode=modes[i % 5 - 1],
+        )
+        for i in range(24)
+    ]
+    bulk_add_qsos(qsos)
 
-def test_next_function_helpers(tmp_path):
-    """Test new helper functions using next() for efficient queries."""
-    import os
-    from datetime import datetime
+    for band, mode in [("20m", None), (None, "SSB"), ("20M", "cw"), (None, None)]:
+        expected = filtered_qsos(list_qsos(limit=10), band=band, mode=mode)
+        got = list_qsos_filtered(limit=10, band=band, mode=mode)
+        assert [q.call for q in got] == [q.call for q in expected]
 
-    # Use temporary database for testing
-    original_db_path = os.environ.get("W4GNS_DB_PATH")
-    os.environ["W4GNS_DB_PATH"] = str(tmp_path / "test_next.sqlite3")
 
-    try:
-        # Create tables
-        create_db_and_tables()
+def test_engine_cached_per_db_path(temp_db, tmp_path, monkeypatch):
+    """Each W4GNS_DB_PATH gets its own cached engine; :memory: keeps one DB."""
+    from w4gns_logger_ai import storage
 
-        # Add test QSOs
-        add_qso(
-            QSO(
-                call="W1ABC",
-                start_at=datetime(2024, 1, 1, 10, 0, 0),
-                band="20m",
-                mode="SSB",
-                freq_mhz=14.250,
-            )
+    monkeypatch.setenv(storage.DB_ENV_VAR, ":memory:")
+    mem = storage.get_engine()
+    assert storage.get_engine() is mem
+    storage.create_db_and_tables()
+    add_qso(QSO(call="M0MEM", start_at=datetime(2024, 1, 1)))
+    assert [q.call for q in list_qsos()] == ["M0MEM"]
+
+    monkeypatch.setenv(storage.DB_ENV_VAR, str(tmp_path / "other.sqlite3"))
+    assert storage.get_engine() is not mem
+    monkeypatch.undo()
+    assert get_first_qso_by_call("M0MEM") is None  # back on the fixture DB
+
+
+def test_bulk_add_parallel_large_batch(temp_db):
+    """Inputs above the serial cutoff go through the prepare/write pipeline."""
+    qsos = [
+        QSO(call=f"N{i}XYZ", start_at=datetime(2024, 2, 1, i // 60 % 24, i % 60), band="20m")
+        for i in range(450)
+    ]
+    assert bulk_add_qsos_parallel(qsos, batch_size=100) == 450
+    assert len(list_qsos(limit=1000)) == 450
+    assert search_qsos(call="N449XYZ")[0].start_at == datetime(2024, 2, 1, 7, 29)
+
+
+def test_bulk_add_parallel_consumes_generator(temp_db):
+    """A one-shot generator is inserted in full, in order, batch by batch."""
+    qsos = (
+        QSO(call=f"G{i}GEN", start_at=datetime(2024, 5, 1, i // 60 % 24, i % 60))
+        for i in range(333)
+    )
+    assert bulk_add_qsos_parallel(qsos, batch_size=50) == 333
+    assert count_qsos() == 333
+    assert search_qsos(call="G332GEN")[0].start_at == datetime(2024, 5, 1, 5, 32)
+
+
+def test_list_qso_rows_stream_matches_list_qsos(temp_db, sample_qso):
+    """QSORow streaming returns the same rows and values as the ORM listing."""
+    from w4gns_logger_ai.models import QSORow
+
+    add_qso(sample_qso)
+    add_qso(QSO(call="W1AW", start_at=datetime(2024, 8, 1, 9, 30), freq_mhz=7.074))
+
+    rows = list(list_qso_rows_stream(limit=10))
+    assert all(isinstance(r, QSORow) for r in rows)
+    assert [
+        (r.id, r.call, r.start_at, r.band, r.freq_mhz, r.grid, r.comment) for r in rows
+    ] == [
+        (q.id, q.call, q.start_at, q.band, q.freq_mhz, q.grid, q.comment)
+        for q in list_qsos(limit=10)
+    ]
+    assert [r.call for r in list_qso_rows_stream(call="w1")] == ["W1AW"]
+
+
+def test_columnar_summary_matches_compute_summary(temp_db):
+    """Summaries from list_qso_columns match compute_summary on the same QSOs."""
+    from w4gns_logger_ai.awards import (
+        AWARD_COUNT_COLUMNS,
+        SUMMARY_COLUMNS,
+        compute_award_counts_from_columns,
+        compute_summary,
+        compute_summary_from_columns,
+    )
+
+    bands = ["20m", " 20M ", "40m", None, ""]
+    grids = ["FN42", " fn42", "IO91", None]
+    qsos = [
+        QSO(
+            call=f" k{i % 7}abc" if i % 2 else f"K{i % 7}ABC",
+            start_at=datetime(2024, 1, 1, 0, i),
+            band=bands[i % 5],
+            mode=["ssb", "CW", None][i % 3],
+            grid=grids[i % 4],
+            country=["USA", " usa ", "Japan", None][i % 4],
         )
-        add_qso(
-            QSO(
-                call="K2XYZ",
-                start_at=datetime(2024, 1, 2, 11, 0, 0),
-                band="40m",
-                mode="CW",
-                freq_mhz=7.050,
-            )
+        for i in range(40)
+    ]
+    bulk_add_qsos(qsos)
+
+    assert list_qso_columns(SUMMARY_COLUMNS, limit=10, band="10m") == {
+        name: [] for name in SUMMARY_COLUMNS
+    }
+    for band in (None, "20m"):
+        columns = list_qso_columns(SUMMARY_COLUMNS, limit=30, band=band)
+        expected = compute_summary(list_qsos_filtered(limit=30, band=band))
+        assert compute_summary_from_columns(columns) == expected
+        assert list(compute_summary_from_columns(columns)["grids_per_band"]) == sorted(
+            expected["grids_per_band"]
         )
-        add_qso(
-            QSO(
-                call="W1DEF",
-                start_at=datetime(2024, 1, 3, 12, 0, 0),
-                band="20m",
-                mode="FT8",
-                freq_mhz=14.074,
-            )
+        counts = compute_award_counts_from_columns(
+            list_qso_columns(AWARD_COUNT_COLUMNS, limit=30, band=band)
         )
+        assert counts == {key: expected[key] for key in counts}
 
-        # Test get_first_qso_by_call - finds first W1 callsign
-        result = get_first_qso_by_call("W1")
-        assert result is not None
-        # Should get most recent W1 (W1DEF is later than W1ABC)
-        assert result.call == "W1DEF"
-
-        # Test with exact call
-        result = get_first_qso_by_call("K2XYZ")
-        assert result is not None
-        assert result.call == "K2XYZ"
-
-        # Test with non-existent call
-        result = get_first_qso_by_call("ZZ9ZZZ")
-        assert result is None
-
-        # Test find_qso_by_frequency
-        result = find_qso_by_frequency(14.250, tolerance=0.001)
-        assert result is not None
-        assert result.call == "W1ABC"
-        assert result.freq_mhz == 14.250
-
-        # Test with broader tolerance
-        result = find_qso_by_frequency(14.000, tolerance=0.100)
-        assert result is not None
-        # Should find W1DEF at 14.074 (most recent within range)
-        assert result.call == "W1DEF"
-
-        # Test with frequency not in database
-        result = find_qso_by_frequency(21.000, tolerance=0.001)
-        assert result is None
 
-    finally:
-        # Cleanup environment
-        if original_db_path:
-            os.environ["W4GNS_DB_PATH"] = original_db_path
-        elif "W4GNS_DB_PATH" in os.environ:
-            del os.environ["W4GNS_DB_PATH"]
-
-
-def test_streaming_functions(tmp_path):
-    """Test generator-based streaming functions for memory efficiency."""
-    import os
-    from datetime import datetime
+def test_count_qsos(temp_db, sample_qso):
+    """count_qsos counts every stored QSO, beyond any list limit."""
+    assert count_qsos() == 0
+    bulk_add_qsos(
+        QSO(call=f"K{i}ABC", start_at=datetime(2024, 1, 1, 0, i % 60)) for i in range(150)
+    )
+    add_qso(sample_qso)
+    assert count_qsos() == 151
 
-    # Import storage module to access engine
-    from w4gns_logger_ai import storage
 
-    # Use temporary database for testing
-    original_db_path = os.environ.get("W4GNS_DB_PATH")
-    test_db = str(tmp_path / "test_stream.sqlite3")
-    os.environ["W4GNS_DB_PATH"] = test_db
+def test_qso_log_stamp_tracks_adds_and_deletes(temp_db, sample_qso):
+    """qso_log_stamp changes when QSOs are added or deleted."""
+    assert qso_log_stamp() == (0, None)
+    saved = add_qso(sample_qso)
+    after_add = qso_log_stamp()
+    assert after_add == (1, saved.id)
+    delete_qso(saved.id)
+    assert qso_log_stamp() != after_add
 
-    try:
-        # Reset the cached engine to force new connection
-        storage._engine = None
-
-        # Create tables
-        create_db_and_tables()
-
-        # Add test QSOs - use unique calls
-        for i in range(20):
-            add_qso(
-                QSO(
-                    call=f"W{i % 3}STREAM",  # W0STREAM, W1STREAM, W2STREAM repeating
-                    start_at=datetime(2024, 1, i + 1, 12, 0, 0),
-                    band="20m" if i % 2 == 0 else "40m",
-                    mode="SSB" if i % 3 == 0 else "CW",
-                    freq_mhz=14.0 + i * 0.1,
-                )
-            )
 
-        # Test list_qsos_stream - should yield items one at a time
-        stream_count = 0
-        for qso in list_qsos_stream(limit=10):
-            assert "STREAM" in qso.call
-            stream_count += 1
-        assert stream_count == 10
-
-        # Test search_qsos_stream - filter by band
-        band_count = 0
-        for qso in search_qsos_stream(band="20m", limit=20):
-            assert qso.band == "20m"
-            band_count += 1
-        assert band_count == 10  # Half are 20m
-
-        # Test search_qsos_stream - filter by call
-        call_count = 0
-        for qso in search_qsos_stream(call="W1", limit=20):
-            assert "W1" in qso.call
-            call_count += 1
-        # Should match W1STREAM entries
-        assert call_count > 0
-
-        # Test streaming with early termination (generator efficiency)
-        first_five = []
-        for i, qso in enumerate(list_qsos_stream(limit=100)):
-            first_five.append(qso)
-            if i >= 4:  # Stop after 5
-                break
-        assert len(first_five) == 5
-
-        # Verify streaming uses less memory than list
-        stream_result = list_qsos_stream(limit=5)
-        assert hasattr(stream_result, "__iter__")
-        assert hasattr(stream_result, "__next__")
+def test_bulk_add_qsos_consumes_generator_in_batches(temp_db, monkeypatch):
+    """A lazy source spanning several insert batches is written in full."""
+    from w4gns_logger_ai import storage
 
-    finally:
-        # Cleanup environment
-        if original_db_path:
-            os.environ["W4GNS_DB_PATH"] = original_db_path
-        elif "W4GNS_DB_PATH" in os.environ:
-            del os.environ["W4GNS_DB_PATH"]
-        # Reset engine again to pick up restored path
-        storage._engine = None
+    monkeypatch.setattr(storage, "BULK_INSERT_BATCH_SIZE", 40)
+    qsos = (QSO(call=f"W{i}GEN", start_at=datetime(2024, 3, 1, 0, i % 60)) for i in range(100))
+    assert bulk_add_qsos(qsos) == 100
+    assert count_qsos() == 100
 
 
+def test_delete_qsos_removes_only_given_ids(temp_db, monkeypatch):
+    """delete_qsos removes the listed QSOs, across batches, and skips unknown ids."""
+    from w4gns_logger_ai import storage
 
+    monkeypatch.setattr(storage, "_ID_BATCH_SIZE", 3)
+    saved = [
+        add_qso(QSO(call=f"K{i}DEL", start_at=datetime(2024, 4, 1, 0, i)))
+        for i in range(10)
+    ]
+    doomed = [q.id for q in saved[:7]] + [99999]
+    assert delete_qsos(doomed) == 7
+    assert sorted(q.call for q in list_qsos(limit=20)) == ["K7DEL", "K8DEL", "K9DEL"]
+    assert delete_qsos([]) == 0
+
+
+def test_bulk_insert_stores_same_text_as_orm(temp_db, sample_qso):
+    """Bulk-inserted rows are stored exactly like add_qso() rows."""
+    bulk = sample_qso.model_copy(update={"call": "K2BULK"})
+    add_qso(sample_qso)
+    bulk_add_qsos([bulk])
+    with session_scope() as session:
+        rows = session.execute(
+            text("SELECT call, start_at, freq_mhz, comment FROM qso ORDER BY id")
+        ).all()
+    assert [tuple(r)[1:] for r in rows] == [tuple(rows[0])[1:]] * 2
+    assert [r.call for r in search_qsos(call="K2BULK")] == ["K2BULK"]
+
+    # Sub-second start times take the same text through both paths too
+    fields = sample_qso.model_dump(exclude={"id", "start_at"})
+    start_at = sample_qso.start_at.replace(microsecond=1234)
+    add_qso(QSO(**fields, start_at=start_at))
+    bulk_add_qsos([QSO(**fields, start_at=start_at)])
+    with session_scope() as session:
+        stamps = session.execute(
+            text("SELECT start_at FROM qso WHERE start_at LIKE '%.001234'")
+        ).scalars().all()
+    assert len(stamps) == 2 and stamps[0] == stamps[1]
+
+
+def test_get_qsos_by_ids(temp_db, monkeypatch):
+    """get_qsos returns the existing QSOs keyed by id, across id batches."""
+    from w4gns_logger_ai import storage
 
+    monkeypatch.setattr(storage, "_ID_BATCH_SIZE", 2)
+    saved = [
+        add_qso(QSO(call=f"K{i}GET", start_at=datetime(2024, 6, 1, 0, i)))
+        for i in range(5)
+    ]
+    wanted = [saved[4].id, saved[0].id, saved[2].id, 99999]
+    got = get_qsos(wanted)
+    assert {i: q.call for i, q in got.items()} == {
+        saved[4].id: "K4GET",
+        saved[0].id: "K0GET",
+        saved[2].id: "K2GET",
+    }
+    assert get_qsos([]) == {}
+
+
+def test_search_qsos_call_match_modes(temp_db):
+    """call_match picks substring, prefix or exact call matching, case-insensitively."""
+    bulk_add_qsos(
+        QSO(call=call, start_at=datetime(2024, 6, 1, 0, i))
+        for i, call in enumerate(["W1AW", "W1AWX", "KW1AW", "K1ABC"])
+    )
+
+    def calls(**kw):
+        return sorted(q.call for q in search_qsos(**kw))
+
+    assert calls(call="w1aw") == ["KW1AW", "W1AW", "W1AWX"]
+    assert calls(call="w1aw", call_match="prefix") == ["W1AW", "W1AWX"]
+    assert calls(call="w1aw", call_match="exact") == ["W1AW"]
+    # A typed % or _ is literal in a prefix, not a wildcard
+    assert calls(call="K_", call_match="prefix") == []
+    assert calls(call="%1AW", call_match=CallMatch.PREFIX) == []
+    assert calls(call="K1A", call_match=CallMatch.PREFIX) == ["K1ABC"]
+    with session_scope() as session:
+        plan = session.execute(
+            text("EXPLAIN QUERY PLAN SELECT id FROM qso WHERE call LIKE 'W1%'")
+        ).all()
+    assert "ix_qso_call_nocase" in str(plan)
+    with pytest.raises(RuntimeError, match="call_match"):
+        search_qsos(call="W1AW", call_match="fuzzy")
+
+
+def test_concurrent_bulk_imports_take_turns(temp_db):
+    """Bulk imports from several threads all land, one transaction at a time."""
+
+    def run(fn, tag):
+        fn(QSO(call=f"K{i}{tag}", start_at=datetime(2024, 7, 1)) for i in range(300))
+
+    importers = [
+        (bulk_add_qsos_parallel, "PA"),
+        (bulk_add_qsos_parallel, "PB"),
+        (bulk_add_qsos, "SQ"),
+    ]
+    threads = [threading.Thread(target=run, args=args) for args in importers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert count_qsos() == 900
+
+
+def test_create_db_drops_redundant_indexes(temp_db):
+    """Single-column indexes covered by the composite ones are dropped on start."""
+    from w4gns_logger_ai.storage import create_db_and_tables
+
+    with session_scope() as session:
+        session.execute(text("CREATE INDEX ix_qso_band ON qso (band)"))
+        session.execute(text("CREATE INDEX ix_qso_call ON qso (call)"))
+        session.commit()
+    create_db_and_tables()
+    with session_scope() as session:
+        names = set(
+            session.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            ).scalars()
+        )
+    assert not names & {"ix_qso_band", "ix_qso_mode", "ix_qso_grid", "ix_qso_call"}
+    assert {"ix_qso_band_start_at", "ix_qso_call_nocase"} <= names
@@ -3,20 +3,26 @@
 We support the most common fields used by this logger. The parser is intentionally
 simple and tolerant; it looks for <TAG:len>value pairs and splits on <EOR>.
 
-Multi-threaded processing is used for large ADIF files to improve performance.
-
 C Extensions: Automatically uses high-performance Cython extensions when available,
 falls back to pure Python implementation if not compiled.
 """
 
 from __future__ import annotations
 
+import codecs
 import concurrent.futures
-import multiprocessing
+import io
+import re
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Dict, Iterable, Iterator, List
+from functools import lru_cache
+from operator import attrgetter
+from typing import BinaryIO, Dict, Iterable, Iterator, List, TextIO
+
+from sqlalchemy.orm import class_mapper
 
 from .models import QSO
+from .parallel_utils import get_optimal_workers
 
 # Try to import C-optimized functions, fall back to pure Python
 try:
@@ -34,6 +40,9 @@ except ImportError:
 # ADIF spec: https://www.adif.org/
 
 
+# <NAME:LENGTH> or <NAME:LENGTH:TYPE>; tags without a numeric length are skipped
+_TAG_RE = re.compile(r"<([^:>]*):(\d+)(?::[^>]*)?>")
+
 FIELD_MAP_IN = {
     "CALL": "call",
     "QSO_DATE": "date",
@@ -50,6 +59,16 @@ FIELD_MAP_IN = {
     "COMMENT": "comment",
 }
 
+# Raw tag spelling -> FIELD_MAP_IN key, so the usual upper- and lower-case
+# spellings resolve with one dict lookup instead of str.upper() per tag
+_TAG_NAMES = {spelling: tag for tag in FIELD_MAP_IN for spelling in (tag, tag.lower())}
+
+ADIF_HEADER_LINES = (
+    "<ADIF_VER:3>3.1\n",
+    "<PROGRAMID:13>W4GNS Logger\n",
+    "<EOH>\n",
+)
+
 FIELD_MAP_OUT = {
     "call": "CALL",
     "band": "BAND",
@@ -69,187 +88,362 @@ def _parse_adif_record(text: str) -> Dict[str, str]:
     """Extract a dict of ADIF tag->value from a single record chunk.
 
     This is a best-effort parser that respects <TAG:len>value and ignores type hints.
+    Only tags in FIELD_MAP_IN are returned; other fields (e.g. MY_GRIDSQUARE
+    written by other loggers) are skipped without slicing out their values.
     Uses C-optimized version when available for 10-20x speedup.
     """
     if USE_C_EXTENSIONS:
         return _parse_adif_record_c(text)
-    
-    # Pure Python fallback
-    i = 0
-    n = len(text)
+
+    # Pure Python fallback: one _TAG_RE.split call tokenizes the whole record
+    # in C as [prefix, name, length, value, name, length, value, ...]. Each
+    # value piece runs up to the next tag, so it can only be shorter than its
+    # declared length when the value itself contains tag-like text; those
+    # records are re-parsed with the cursor scan, which skips over values.
+    parts = _TAG_RE.split(text)
+    known = _TAG_NAMES.get
     rec: Dict[str, str] = {}
-    while i < n:
-        if text[i] != "<":
-            i += 1
-            continue
-        j = text.find(">", i)
-        if j == -1:
-            break
-        tag = text[i + 1 : j]
-        parts = tag.split(":")
-        name = parts[0].upper()
-        length = None
-        if len(parts) >= 2:
-            try:
-                length = int(parts[1])
-            except ValueError:
-                length = None
-        # Skip type (parts[2]) if present
-        i = j + 1
-        if length is None:
-            # No length; skip
-            continue
-        val = text[i : i + length]
-        rec[name] = val
-        i += length
+    for i in range(1, len(parts), 3):
+        length = int(parts[i + 1])
+        value = parts[i + 2]
+        if len(value) < length:
+            return _scan_adif_record(text)
+        tag = known(parts[i])
+        if tag is None:
+            # Mixed-case spelling of a known tag, or a tag nothing reads
+            tag = parts[i].upper()
+            if tag not in FIELD_MAP_IN:
+                continue
+        rec[tag] = value if len(value) == length else value[:length]
     return rec
 
 
-def _process_adif_chunk(chunk: str) -> QSO | None:
-    """Process a single ADIF record chunk into a QSO object.
+def _scan_adif_record(text: str) -> Dict[str, str]:
+    """Parse a record tag by tag, moving a cursor past each value.
 
-    This function is designed to be called from multiple threads/processes.
-    Returns None for invalid records.
-    Uses C-optimized version when available for 10-20x speedup.
+    The regex finds each <NAME:LEN[:TYPE]> tag in C; the cursor then skips
+    the value so tag-like text inside it is ignored.
     """
-    if USE_C_EXTENSIONS:
-        result = _process_adif_chunk_c(chunk)
-        if result is None:
-            return None
-        # Convert dict to QSO object
-        return QSO(**result)
-    
-    # Pure Python fallback
+    search = _TAG_RE.search
+    known = _TAG_NAMES.get
+    pos = 0
+    rec: Dict[str, str] = {}
+    while (m := search(text, pos)) is not None:
+        name, length = m.groups()
+        start = m.end()
+        pos = start + int(length)
+        tag = known(name)
+        if tag is None:
+            tag = name.upper()
+            if tag not in FIELD_MAP_IN:
+                continue
+        rec[tag] = text[start:pos]
+    return rec
+
+
+@lru_cache(maxsize=65536)
+def _parse_qso_datetime(date: str, time: str) -> datetime | None:
+    """Parse QSO_DATE (yyyymmdd) and TIME_ON (hhmm[ss]), or None if invalid.
+
+    Memoized because logs repeat the same date/time pairs heavily (contest
+    logs log many QSOs per minute); datetimes are immutable, so QSOs can
+    share them. Call _parse_qso_datetime.cache_clear() to drop the cache.
+    """
+    if len(date) < 8 or len(time) < 4:
+        return None
+    stamp = date[:8] + (time[:6] if len(time) >= 6 else time[:4])
+    if not (stamp.isascii() and stamp.isdigit()):
+        return None
+
+    # Fixed-width ASCII digits: combine byte values arithmetically instead of
+    # running int() on six slices. 48 is ord("0"), so 528 == 48 * 11 and
+    # 53328 == 48 * 1111 remove the ASCII offsets in one subtraction.
+    b = stamp.encode("ascii")
+    y = b[0] * 1000 + b[1] * 100 + b[2] * 10 + b[3] - 53328
+    m = b[4] * 10 + b[5] - 528
+    d = b[6] * 10 + b[7] - 528
+    hh = b[8] * 10 + b[9] - 528
+    mm = b[10] * 10 + b[11] - 528
+    ss = b[12] * 10 + b[13] - 528 if len(b) == 14 else 0
     try:
-        rec = _parse_adif_record(chunk)
-        if not rec:
-            return None
-
-        # Build QSO from fields
-        call = rec.get("CALL")
-        if not call:
-            return None
-
-        date = rec.get("QSO_DATE")
-        time = rec.get("TIME_ON")
-        dt = None
-        if date and time:
-            try:
-                # yyyymmdd + hhmm[ss]
-                if len(date) < 8 or len(time) < 4:
-                    return None  # Skip invalid date/time format
-                y, m, d = int(date[0:4]), int(date[4:6]), int(date[6:8])
-                hh, mm = int(time[0:2]), int(time[2:4])
-                ss = int(time[4:6]) if len(time) >= 6 else 0
-                dt = datetime(y, m, d, hh, mm, ss)
-            except (ValueError, IndexError):
-                # Skip records with invalid date/time
-                return None
-        else:
-            # If missing, skip record
-            return None
-
-        # Parse frequency with error handling
-        freq_mhz = None
-        if rec.get("FREQ"):
-            try:
-                freq_mhz = float(rec["FREQ"])
-            except (ValueError, TypeError):
-                freq_mhz = None
-
-        return QSO(
-            call=call,
-            start_at=dt,
-            band=rec.get("BAND"),
-            mode=rec.get("MODE"),
-            freq_mhz=freq_mhz,
-            rst_sent=rec.get("RST_SENT"),
-            rst_rcvd=rec.get("RST_RCVD"),
-            name=rec.get("NAME"),
-            qth=rec.get("QTH"),
-            grid=rec.get("GRIDSQUARE"),
-            country=rec.get("COUNTRY"),
-            comment=rec.get("COMMENT"),
-        )
-    except Exception:
-        # Skip any record that causes unexpected errors
+        return datetime(y, m, d, hh, mm, ss)
+    except ValueError:  # out-of-range field, e.g. month 13
         return None
 
 
-def load_adif_parallel(text: str, max_workers: int = None) -> List[QSO]:
-    """Parse ADIF text using parallel processing for improved performance.
+# Creates a bare, instrumented QSO the way SQLAlchemy does for rows it loads
+_new_qso_instance = class_mapper(QSO).class_manager.new_instance
 
-    Uses ThreadPoolExecutor for I/O bound parsing operations.
-    Falls back to sequential processing for small files or on errors.
 
-    Args:
-        text: ADIF text content
-        max_workers: Maximum number of worker threads (defaults to CPU count)
+def _qso_from_fields(fields: Dict[str, object]) -> QSO:
+    """Build a QSO from a dict holding every field except id.
+
+    Equivalent to QSO(**fields) (table models are not validated on init),
+    but the values go straight into the instance __dict__ as SQLAlchemy does
+    when loading rows, instead of through one instrumented setattr per
+    field. That makes construction roughly 9x cheaper, which dominated
+    import time for large logs. The result behaves like any new QSO: setting
+    attributes, session.add() and bulk inserts all work as usual.
+    """
+    qso = _new_qso_instance()
+    values = qso.__dict__
+    values["id"] = None
+    values.update(fields)
+    object.__setattr__(qso, "__pydantic_fields_set__", set(fields))
+    return qso
+
+
+def _has_tag(chunk: str, upper: str, lower: str, pattern: re.Pattern) -> bool:
+    """Cheaply test whether `chunk` contains a tag opener such as "<CALL:".
+
+    The two common spellings are plain substring scans; only chunks with
+    neither pay for the case-insensitive regex.
+    """
+    return upper in chunk or lower in chunk or pattern.search(chunk) is not None
+
+
+_CALL_TAG_RE = re.compile(r"<call:", re.IGNORECASE)
+_QSO_DATE_TAG_RE = re.compile(r"<qso_date:", re.IGNORECASE)
+
+
+def _chunk_fields(chunk: str) -> Dict[str, object] | None:
+    """Parse one ADIF record chunk into QSO field values (every field but id).
 
-    Returns:
-        List of parsed QSO objects
+    Returns None for invalid records. The plain dict is cheap to pickle, so
+    process workers return these and the parent builds the QSOs.
+    Uses C-optimized version when available for 10-20x speedup.
     """
-    chunks = [chunk.strip() for chunk in text.split("<EOR>") if chunk.strip()]
+    # Reject headers and other chunks that cannot hold a QSO before the
+    # full tag scan; every valid record has a CALL and a QSO_DATE tag
+    if not (
+        _has_tag(chunk, "<CALL:", "<call:", _CALL_TAG_RE)
+        and _has_tag(chunk, "<QSO_DATE:", "<qso_date:", _QSO_DATE_TAG_RE)
+    ):
+        return None
 
-    # Use sequential processing for small files
-    if len(chunks) < 100:
-        return load_adif(text)
+    if USE_C_EXTENSIONS:
+        return _process_adif_chunk_c(chunk)
+    
+    # Pure Python fallback. Every check is explicit, so invalid records
+    # return early without raising; only FREQ needs a guard, since float()
+    # is the one conversion that can fail on record text.
+    rec = _parse_adif_record(chunk)
+    call = rec.get("CALL")
+    date = rec.get("QSO_DATE")
+    time = rec.get("TIME_ON")
+    if not call or not date or not time:
+        return None
+    dt = _parse_qso_datetime(date, time)
+    if dt is None:
+        # Skip records with invalid date/time
+        return None
 
-    # Use conservative worker count for CI compatibility
-    if max_workers is None:
+    freq_mhz = None
+    if freq := rec.get("FREQ"):
         try:
-            max_workers = min(4, max(1, (multiprocessing.cpu_count() or 1)))
-        except (OSError, NotImplementedError):
-            # Some CI environments don't support cpu_count()
-            max_workers = 2
+            freq_mhz = float(freq)
+        except ValueError:
+            freq_mhz = None
+
+    return {
+        "call": call,
+        "start_at": dt,
+        "band": rec.get("BAND"),
+        "mode": rec.get("MODE"),
+        "freq_mhz": freq_mhz,
+        "rst_sent": rec.get("RST_SENT"),
+        "rst_rcvd": rec.get("RST_RCVD"),
+        "name": rec.get("NAME"),
+        "qth": rec.get("QTH"),
+        "grid": rec.get("GRIDSQUARE"),
+        "country": rec.get("COUNTRY"),
+        "comment": rec.get("COMMENT"),
+    }
 
-    records: List[QSO] = []
 
-    try:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all chunks for parallel processing
-            future_to_chunk = {
-                executor.submit(_process_adif_chunk, chunk): chunk
-                for chunk in chunks
-            }
-
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_chunk):
-                try:
-                    result = future.result(timeout=30)  # Add timeout for CI
-                    if result is not None:
-                        records.append(result)
-                except (Exception, concurrent.futures.TimeoutError):
-                    # Skip failed chunks
-                    continue
-
-    except Exception:
-        # Fall back to sequential processing on any threading errors
-        return load_adif(text)
-
-    return records
-
-
-def load_adif(text: str) -> List[QSO]:
+def _process_adif_chunk(chunk: str) -> QSO | None:
+    """Process a single ADIF record chunk into a QSO object.
+
+    Returns None for invalid records.
+    """
+    fields = _chunk_fields(chunk)
+    return None if fields is None else _qso_from_fields(fields)
+
+
+def _chunk_fields_batch(chunks: List[str]) -> List[Dict[str, object]]:
+    """Process-pool task: parse a batch of record chunks into field dicts."""
+    return [fields for chunk in chunks if (fields := _chunk_fields(chunk)) is not None]
+
+
+def _as_text(text: str | bytes) -> str:
+    """Decode raw ADIF bytes the same way the CLI reads files; pass str through."""
+    if isinstance(text, bytes):
+        return text.decode("utf-8", errors="ignore")
+    return text
+
+
+def _iter_records(text: str) -> Iterator[str]:
+    """Yield the text between <EOR> markers one record at a time.
+
+    Equivalent to text.split("<EOR>") without materializing the list;
+    str.find does the scanning in C. Blank trailing text is dropped.
+    """
+    find = text.find
+    start = 0
+    while (end := find("<EOR>", start)) != -1:
+        yield text[start:end]
+        start = end + 5
+    tail = text[start:]
+    if tail.strip():
+        yield tail
+
+
+def _iter_stream_records(
+    stream: BinaryIO | TextIO, block_size: int
+) -> Iterator[str]:
+    """Yield records from a file object read `block_size` at a time.
+
+    Text after the last <EOR> in a block (including a marker split across
+    blocks) is carried over into the next read, so only one block plus one
+    partial record is held in memory. Binary streams are decoded
+    incrementally, like _as_text().
+    """
+    decode = codecs.getincrementaldecoder("utf-8")(errors="ignore").decode
+    pending = ""
+    while block := stream.read(block_size):
+        pending += decode(block) if isinstance(block, bytes) else block
+        cut = pending.rfind("<EOR>")
+        if cut != -1:
+            yield from _iter_records(pending[: cut + 5])
+            pending = pending[cut + 5 :]
+    pending += decode(b"", final=True)
+    if pending.strip():
+        yield pending
+
+
+def iter_adif(
+    source: str | bytes | BinaryIO | TextIO, block_size: int = 4 * 1024 * 1024
+) -> Iterator[QSO]:
+    """Lazily parse ADIF into QSOs, yielding each one as its record is read.
+
+    `source` may be ADIF text, raw bytes, or a file object opened in text
+    or binary mode. File objects are read in `block_size` pieces, so a log
+    never has to fit in memory at once; peak memory is one block plus the
+    QSOs the caller keeps. Skips the same invalid records as load_adif().
+
+    Example:
+        with open('log.adi', 'rb') as f:
+            for qso in iter_adif(f):
+                add_qso(qso)
+    """
+    if isinstance(source, (str, bytes)):
+        records = _iter_records(_as_text(source))
+    else:
+        records = _iter_stream_records(source, block_size)
+    for chunk in records:
+        if (qso := _process_adif_chunk(chunk)) is not None:
+            yield qso
+
+
+def load_adif(text: str | bytes) -> List[QSO]:
     """Parse ADIF text into a list of QSO objects (best effort).
 
     Records without CALL or without both QSO_DATE and TIME_ON are skipped.
-    Invalid data is logged and skipped gracefully.
-
-    For large files, consider using load_adif_parallel() for better performance.
+    Invalid data is logged and skipped gracefully. Raw file bytes are
+    accepted too and decoded as UTF-8, ignoring undecodable bytes; prefer
+    passing them over text read in text mode, whose newline translation
+    shortens multi-line CRLF values below their declared length.
+
+    Records are parsed in one sequential pass. Parsing holds the GIL for
+    nearly all of its work (building dicts and QSO models), so a thread pool
+    only added executor overhead: on 20k records it was ~45% slower in pure
+    Python and ~10% slower with the C extension.
     """
-    chunks = text.split("<EOR>")
+    return list(iter_adif(text))
+
+
+# Below this many records process start-up and pickling outweigh the gain
+PROCESS_PARSE_MIN_RECORDS = 10_000
+# Records per process-pool task, large enough to amortize pickling
+PROCESS_PARSE_BATCH_SIZE = 500
+# Peak resident memory of one parse worker: an interpreter with this package
+# imported plus one batch in flight measured about 64 MB
+PROCESS_PARSE_WORKER_BYTES = 64 * 1024 * 1024
+
 
-    # Use parallel processing for large files
-    if len(chunks) > 500:
-        return load_adif_parallel(text)
+def load_adif_parallel(text: str | bytes, max_workers: int = None) -> List[QSO]:
+    """Parse ADIF text into QSOs, using worker processes for very large logs.
 
-    # Use list comprehension with next() pattern for cleaner code
-    records: List[QSO] = [
-        qso for chunk in chunks if (qso := _process_adif_chunk(chunk)) is not None
+    Logs with more than PROCESS_PARSE_MIN_RECORDS records are split into
+    batches of PROCESS_PARSE_BATCH_SIZE and parsed in a ProcessPoolExecutor;
+    parsing holds the GIL, so only processes give real multi-core scaling.
+    Workers return plain field dicts (SQLModel instances pickle poorly) and
+    the QSOs are built here, in input order. Smaller logs, single-core
+    machines, and platforms where a process pool cannot start fall back to
+    the sequential load_adif() path with identical results, as do builds
+    with the C extension: it parses faster than the parent alone can unpickle
+    results and build QSOs, so worker processes would only add overhead.
+
+    Args:
+        text: ADIF text or raw file bytes
+        max_workers: Worker processes (default: one per physical core, fewer
+            if available memory cannot hold that many)
+    """
+    text = _as_text(text)
+    chunks = list(_iter_records(text))
+    workers = max_workers or get_optimal_workers(
+        "cpu", estimated_bytes_per_worker=PROCESS_PARSE_WORKER_BYTES
+    )
+    if USE_C_EXTENSIONS or len(chunks) <= PROCESS_PARSE_MIN_RECORDS or workers < 2:
+        return [qso for chunk in chunks if (qso := _process_adif_chunk(chunk)) is not None]
+
+    batches = [
+        chunks[i : i + PROCESS_PARSE_BATCH_SIZE]
+        for i in range(0, len(chunks), PROCESS_PARSE_BATCH_SIZE)
     ]
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            return [
+                _qso_from_fields(fields)
+                for batch in executor.map(_chunk_fields_batch, batches)
+                for fields in batch
+            ]
+    except (OSError, BrokenProcessPool):
+        # e.g. no working semaphores in a sandbox; parse in-process instead
+        return [qso for chunk in chunks if (qso := _process_adif_chunk(chunk)) is not None]
+
 
-    return records
+def _field(tag: str, value: str) -> str:
+    """Format one ADIF field as <TAG:len>value."""
+    return f"<{tag}:{len(value)}>{value}"
+
+
+@lru_cache(maxsize=4096)
+def _freq_field(freq_mhz: float) -> str:
+    """Format a FREQ field with up to 6 decimals and no trailing zeros.
+
+    Memoized because logs reuse a small set of frequencies (FT8 watering
+    holes, repeaters, contest runs), so most QSOs skip formatting entirely.
+    """
+    return _field("FREQ", f"{freq_mhz:.6f}".rstrip("0").rstrip("."))
+
+
+# Optional text fields in output order, split around FREQ (a float, formatted
+# separately). One attrgetter call fetches each group as a tuple.
+_OUT_FIELDS_BEFORE_FREQ = (("band", "BAND"), ("mode", "MODE"))
+_OUT_FIELDS_AFTER_FREQ = (
+    ("rst_sent", "RST_SENT"),
+    ("rst_rcvd", "RST_RCVD"),
+    ("name", "NAME"),
+    ("qth", "QTH"),
+    ("grid", "GRIDSQUARE"),
+    ("country", "COUNTRY"),
+    ("comment", "COMMENT"),
+)
+_OUT_TAGS_BEFORE_FREQ = tuple(tag for _, tag in _OUT_FIELDS_BEFORE_FREQ)
+_OUT_TAGS_AFTER_FREQ = tuple(tag for _, tag in _OUT_FIELDS_AFTER_FREQ)
+_out_values_before_freq = attrgetter(*(attr for attr, _ in _OUT_FIELDS_BEFORE_FREQ))
+_out_values_after_freq = attrgetter(*(attr for attr, _ in _OUT_FIELDS_AFTER_FREQ))
 
 
 def dump_adif_stream(qsos: Iterable[QSO]) -> Iterator[str]:
@@ -276,57 +470,70 @@ def dump_adif_stream(qsos: Iterable[QSO]) -> Iterator[str]:
     
     # Pure Python fallback
     # Yield header
-    yield "<ADIF_VER:3>3.1\n"
-    yield "<PROGRAMID:13>W4GNS Logger\n"
-    yield "<EOH>\n"
+    yield from ADIF_HEADER_LINES
 
     # Stream records
     for q in qsos:
         dt = q.start_at
-        date = dt.strftime("%Y%m%d")
-        time = dt.strftime("%H%M%S")
-
-        def field(tag: str, value: str) -> str:
-            return f"<{tag}:{len(value)}>{value}"
+        # Integer formatting skips strftime's format-string parsing per call
+        date = f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+        time = f"{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
 
         parts = [
-            field("QSO_DATE", date),
-            field("TIME_ON", time),
-            field("CALL", q.call),
+            _field("QSO_DATE", date),
+            _field("TIME_ON", time),
+            _field("CALL", q.call),
         ]
 
-        if q.band:
-            parts.append(field("BAND", q.band))
-        if q.mode:
-            parts.append(field("MODE", q.mode))
+        for tag, value in zip(_OUT_TAGS_BEFORE_FREQ, _out_values_before_freq(q)):
+            if value:
+                parts.append(f"<{tag}:{len(value)}>{value}")
         if q.freq_mhz is not None:
-            parts.append(
-                field("FREQ", f"{q.freq_mhz:.6f}".rstrip("0").rstrip("."))
-            )
-        if q.rst_sent:
-            parts.append(field("RST_SENT", q.rst_sent))
-        if q.rst_rcvd:
-            parts.append(field("RST_RCVD", q.rst_rcvd))
-        if q.name:
-            parts.append(field("NAME", q.name))
-        if q.qth:
-            parts.append(field("QTH", q.qth))
-        if q.grid:
-            parts.append(field("GRIDSQUARE", q.grid))
-        if q.country:
-            parts.append(field("COUNTRY", q.country))
-        if q.comment:
-            parts.append(field("COMMENT", q.comment))
+            parts.append(_freq_field(q.freq_mhz))
+        for tag, value in zip(_OUT_TAGS_AFTER_FREQ, _out_values_after_freq(q)):
+            if value:
+                parts.append(f"<{tag}:{len(value)}>{value}")
 
         parts.append("<EOR>")
         yield "".join(parts) + "\n"
 
 
-def dump_adif(qsos: Iterable[QSO]) -> str:
+def dump_adif(qsos: Iterable[QSO], out: TextIO | None = None) -> str:
     """Serialize QSOs to ADIF text with a minimal header and <EOR>-terminated records.
 
-    For large exports, consider using dump_adif_stream() for better memory efficiency.
+    Records are written one at a time into `out` (any text file-like object),
+    so no list of record strings is ever held. If `out` is given the ADIF goes
+    there and an empty string is returned; otherwise an io.StringIO is used as
+    the sink and its contents are returned.
     """
-    # Use streaming internally, then join (backward compatible)
-    return "".join(dump_adif_stream(qsos))
+    sink = io.StringIO() if out is None else out
+    write = sink.write
+    for line in dump_adif_stream(qsos):
+        write(line)
+    return sink.getvalue() if out is None else ""
 
+
+def dump_adif_to(
+    stream: BinaryIO, qsos: Iterable[QSO], buffer_size: int = 64 * 1024
+) -> int:
+    """Write ADIF for `qsos` to a binary stream, returning how many QSOs were written.
+
+    Records are UTF-8 encoded into one reusable bytearray and flushed to the
+    stream whenever it reaches `buffer_size`, so peak memory stays bounded no
+    matter how many QSOs are exported and no full-size string is ever built.
+
+    Example:
+        with open('export.adi', 'wb') as f:
+            dump_adif_to(f, qsos)
+    """
+    buf = bytearray()
+    count = -len(ADIF_HEADER_LINES)
+    for line in dump_adif_stream(qsos):
+        buf += line.encode("utf-8")
+        count += 1
+        if len(buf) >= buffer_size:
+            stream.write(buf)
+            buf.clear()
+    if buf:
+        stream.write(buf)
+    return max(count, 0)
@@ -3,25 +3,44 @@
 When OpenAI is configured via OPENAI_API_KEY, we use GPT models for enhanced insights.
 Otherwise, we fall back to deterministic, local-only approaches.
 
-Enhanced with concurrent processing for improved performance.
+Batch helpers issue their OpenAI requests concurrently with asyncio.
 """
 
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures
 import os
-from typing import Iterable, List
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Coroutine, Iterable, List, TypeVar
 
-from .awards import compute_summary, suggest_awards
+from .awards import AwardsSummary, compute_summary, suggest_awards
 from .models import QSO
 
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=4)
+def _get_openai_client(api_key: str):
+    """Return a shared synchronous OpenAI client for `api_key`.
+
+    Building a client sets up a new HTTP connection pool and TLS context, so
+    reusing one keeps connections alive across calls. Raises ImportError when
+    the openai package is not installed.
+    """
+    import openai
+
+    return openai.OpenAI(api_key=api_key)
+
 
 def _fallback_summary(qsos: Iterable[QSO]) -> str:
     """Produce a compact local summary when AI is unavailable.
 
     Includes counts of QSOs, unique calls, bands, and modes.
     """
-    qsos = list(qsos)
+    if not isinstance(qsos, list):
+        qsos = list(qsos)
     if not qsos:
         return "No QSOs to summarize."
     calls = {q.call for q in qsos}
@@ -40,17 +59,18 @@ def summarize_qsos(qsos: Iterable[QSO], *, model: str = "gpt-4o-mini") -> str:
     Set environment variable OPENAI_API_KEY to enable the cloud path.
     The response is intentionally short and actionable for operators.
     """
+    # Materialize once: the prompt and the fallback both need the QSOs, and
+    # a generator argument would be exhausted after the first pass
+    qsos_list = list(qsos)
     try:
-        import openai
-
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
-            return _fallback_summary(list(qsos))
-        client = openai.OpenAI(api_key=api_key)
+            return _fallback_summary(qsos_list)
+        client = _get_openai_client(api_key)
         # Build concise bullet list of the most recent QSOs
         lines = []
-        for q in list(qsos)[:50]:
-            parts = [q.start_at.strftime("%Y-%m-%d %H:%MZ"), q.call]
+        for q in islice(qsos_list, 50):
+            parts = [q.start_at.isoformat(sep=" ", timespec="minutes") + "Z", q.call]
             if q.band:
                 parts.append(q.band)
             if q.mode:
@@ -72,7 +92,79 @@ def summarize_qsos(qsos: Iterable[QSO], *, model: str = "gpt-4o-mini") -> str:
         return resp.choices[0].message.content.strip()
     except (ImportError, AttributeError, ValueError, ConnectionError, TimeoutError):
         # Any failure falls back to local summary
-        return _fallback_summary(list(qsos))
+        return _fallback_summary(qsos_list)
+
+
+def _batch_summary_prompt(qsos: List[QSO]) -> str:
+    """Build the summarization prompt for one batch (first 50 QSOs)."""
+    lines = []
+    for q in qsos[:50]:  # Limit per batch
+        parts = [q.start_at.isoformat(sep=" ", timespec="minutes") + "Z", q.call]
+        if q.band:
+            parts.append(q.band)
+        if q.mode:
+            parts.append(q.mode)
+        if q.grid:
+            parts.append(q.grid)
+        lines.append(" | ".join(parts))
+    return (
+        "You are an assistant for a ham radio QSO log. Summarize these QSOs "
+        "into 2-4 short bullet points, highlighting bands, modes, "
+        "notable DX, and patterns.\n\n"
+        + "\n".join(lines)
+    )
+
+
+# Seconds one OpenAI request in a concurrent batch may take before that batch
+# (only) falls back to its local result
+SUMMARY_REQUEST_TIMEOUT = 60
+AWARDS_REQUEST_TIMEOUT = 120
+
+
+def _run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run `coro` to completion and return its result, from synchronous code.
+
+    asyncio.run() refuses to start when this thread already runs an event
+    loop (a notebook, an async app), so in that case the coroutine gets its
+    own loop on a short-lived worker thread; the caller blocks either way,
+    as it would for any synchronous call.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def _summarize_one(client, qsos: List[QSO], model: str) -> str:
+    """Summarize one batch with the async client, falling back locally on error or timeout."""
+    try:
+        resp = await asyncio.wait_for(
+            client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": _batch_summary_prompt(qsos)}],
+                temperature=0.2,
+                max_tokens=200,
+            ),
+            timeout=SUMMARY_REQUEST_TIMEOUT,
+        )
+        return resp.choices[0].message.content.strip()
+    except Exception:  # including TimeoutError: only this batch falls back
+        return _fallback_summary(qsos)
+
+
+async def _summarize_all(
+    api_key: str, qsos_batches: List[List[QSO]], model: str
+) -> List[str]:
+    """Run every batch request concurrently on one event loop and one client."""
+    import openai
+
+    client = openai.AsyncOpenAI(api_key=api_key)
+    try:
+        return await asyncio.gather(*(_summarize_one(client, b, model) for b in qsos_batches))
+    finally:
+        await client.close()
 
 
 def summarize_qsos_parallel(
@@ -80,8 +172,12 @@ def summarize_qsos_parallel(
 ) -> List[str]:
     """Summarize multiple batches of QSOs concurrently using OpenAI.
 
-    Processes multiple QSO batches in parallel for improved performance.
-    Each batch is summarized independently and results are combined.
+    All requests are issued at once from a single thread with the async
+    OpenAI client and asyncio.gather, so concurrency is not capped by a
+    thread pool. Each batch is summarized independently, and a batch whose
+    request fails or exceeds SUMMARY_REQUEST_TIMEOUT gets its local summary
+    without discarding the others; results are in the same order as
+    `qsos_batches`. Safe to call while an event loop is running.
 
     Args:
         qsos_batches: List of QSO batches to process
@@ -91,83 +187,25 @@ def summarize_qsos_parallel(
         List of summary strings, one per batch
     """
     try:
-        import openai
+        import openai  # noqa: F401  (checked here so a missing package falls back)
 
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             return [_fallback_summary(batch) for batch in qsos_batches]
 
-        client = openai.OpenAI(api_key=api_key)
-
-        def process_batch(qsos: List[QSO]) -> str:
-            try:
-                # Build concise bullet list of QSOs
-                lines = []
-                for q in qsos[:50]:  # Limit per batch
-                    parts = [q.start_at.strftime("%Y-%m-%d %H:%MZ"), q.call]
-                    if q.band:
-                        parts.append(q.band)
-                    if q.mode:
-                        parts.append(q.mode)
-                    if q.grid:
-                        parts.append(q.grid)
-                    lines.append(" | ".join(parts))
-
-                prompt = (
-                    "You are an assistant for a ham radio QSO log. Summarize these QSOs "
-                    "into 2-4 short bullet points, highlighting bands, modes, "
-                    "notable DX, and patterns.\n\n"
-                    + "\n".join(lines)
-                )
-
-                resp = client.chat.completions.create(
-                    model=model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.2,
-                    max_tokens=200,
-                )
-                return resp.choices[0].message.content.strip()
-            except Exception:
-                return _fallback_summary(qsos)
-
-        # Use conservative worker count for CI compatibility
-        is_ci = any(env in os.environ for env in ['CI', 'GITHUB_ACTIONS', 'TRAVIS', 'JENKINS'])
-        max_workers = 2 if is_ci else 5
-
-        # Process batches concurrently
-        try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [executor.submit(process_batch, batch) for batch in qsos_batches]
-                results = []
-                for future in concurrent.futures.as_completed(futures, timeout=60):
-                    try:
-                        result = future.result()
-                        results.append(result)
-                    except Exception:
-                        results.append(_fallback_summary([]))
-                return results
-        except concurrent.futures.TimeoutError:
-            # Fallback on timeout
-            return [_fallback_summary(batch) for batch in qsos_batches]
-
+        return _run_coroutine(_summarize_all(api_key, qsos_batches, model))
     except (ImportError, AttributeError, ValueError, ConnectionError, TimeoutError):
         # Fall back to local summaries
         return [_fallback_summary(batch) for batch in qsos_batches]
 
 
-def evaluate_awards(
-    qsos: Iterable[QSO],
-    goals: str | None = None,
-    *,
-    model: str = "gpt-4o-mini",
-) -> str:
-    """Evaluate awards progress and produce a short plan.
+def _awards_base_text(qsos: Iterable[QSO]) -> List[str]:
+    """Deterministic awards summary lines, used as output or as AI prompt context."""
+    return _awards_summary_text(compute_summary(qsos))
 
-    If OpenAI is configured, we provide tailored guidance based on a compact
-    deterministic summary. Otherwise, we return the deterministic baseline.
-    """
-    qsos_list = list(qsos)
-    summary = compute_summary(qsos_list)
+
+def _awards_summary_text(summary: AwardsSummary) -> List[str]:
+    """Format an already computed awards summary as the baseline text lines."""
     base_suggestions = suggest_awards(summary)
     base_text = [
         "Awards summary:",
@@ -181,29 +219,62 @@ def evaluate_awards(
         base_text.extend(f"- {s}" for s in base_suggestions)
     else:
         base_text.append("Suggestions: none yet — keep logging!")
+    return base_text
+
+
+def _awards_prompt(base_text: List[str], goals: str | None) -> str:
+    """Build the awards-plan prompt around the deterministic baseline."""
+    # Keep content compact; include deterministic baseline
+    content_lines = base_text + [
+        "",
+        "Provide a short, actionable plan (3-6 bullets) to reach awards goals.",
+        (
+            "Be specific about band/mode focus, missing entities (countries/grids), "
+            "and operating tips."
+        ),
+    ]
+    if goals:
+        content_lines.append(f"User goals: {goals}")
+    return "\n".join(content_lines)
+
+
+def evaluate_awards(
+    qsos: Iterable[QSO],
+    goals: str | None = None,
+    *,
+    model: str = "gpt-4o-mini",
+) -> str:
+    """Evaluate awards progress and produce a short plan.
+
+    If OpenAI is configured, we provide tailored guidance based on a compact
+    deterministic summary. Otherwise, we return the deterministic baseline.
+    Only that summary is needed, so `qsos` may be a one-shot stream.
+    """
+    return evaluate_awards_from_summary(compute_summary(qsos), goals, model=model)
 
-    try:
-        import openai
 
+def evaluate_awards_from_summary(
+    summary: AwardsSummary,
+    goals: str | None = None,
+    *,
+    model: str = "gpt-4o-mini",
+) -> str:
+    """Like evaluate_awards(), for a summary the caller has already computed.
+
+    Lets callers that keep summaries around (the GUI caches one per filter,
+    or a columnar compute_summary_from_columns() result) skip re-reading
+    and re-summarizing the QSOs.
+    """
+    base_text = _awards_summary_text(summary)
+
+    try:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             return "\n".join(base_text)
-        client = openai.OpenAI(api_key=api_key)
-        # Keep content compact; include deterministic baseline
-        content_lines = base_text + [
-            "",
-            "Provide a short, actionable plan (3-6 bullets) to reach awards goals.",
-            (
-                "Be specific about band/mode focus, missing entities (countries/grids), "
-                "and operating tips."
-            ),
-        ]
-        if goals:
-            content_lines.append(f"User goals: {goals}")
-        prompt = "\n".join(content_lines)
+        client = _get_openai_client(api_key)
         resp = client.chat.completions.create(
             model=model,
-            messages=[{"role": "user", "content": prompt}],
+            messages=[{"role": "user", "content": _awards_prompt(base_text, goals)}],
             temperature=0.2,
             max_tokens=300,
         )
@@ -212,6 +283,41 @@ def evaluate_awards(
         return "\n".join(base_text)
 
 
+async def _evaluate_one(
+    client, qsos: List[QSO], goals: str | None, model: str
+) -> str:
+    """Evaluate one group with the async client; the baseline on error or timeout."""
+    base_text = _awards_base_text(qsos)
+    try:
+        resp = await asyncio.wait_for(
+            client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": _awards_prompt(base_text, goals)}],
+                temperature=0.2,
+                max_tokens=300,
+            ),
+            timeout=AWARDS_REQUEST_TIMEOUT,
+        )
+        return resp.choices[0].message.content.strip()
+    except Exception:  # including TimeoutError: only this group falls back
+        return "\n".join(base_text)
+
+
+async def _evaluate_all(
+    api_key: str, qsos_groups: List[List[QSO]], goals: str | None, model: str
+) -> List[str]:
+    """Run every group evaluation concurrently on one event loop and one client."""
+    import openai
+
+    client = openai.AsyncOpenAI(api_key=api_key)
+    try:
+        return await asyncio.gather(
+            *(_evaluate_one(client, g, goals, model) for g in qsos_groups)
+        )
+    finally:
+        await client.close()
+
+
 def evaluate_awards_concurrent(
     qsos_groups: List[List[QSO]],
     goals: str | None = None,
@@ -220,8 +326,12 @@ def evaluate_awards_concurrent(
 ) -> List[str]:
     """Evaluate awards progress for multiple QSO groups concurrently.
 
-    Processes multiple groups of QSOs in parallel for comprehensive analysis.
-    Useful for analyzing awards progress across different bands/modes simultaneously.
+    Useful for analyzing awards progress across different bands/modes
+    simultaneously. Requests run concurrently via the async OpenAI client
+    and asyncio.gather; results are in the same order as `qsos_groups`.
+    Without OpenAI, each group gets its deterministic baseline, as does any
+    group whose request fails or exceeds AWARDS_REQUEST_TIMEOUT. Safe to
+    call while an event loop is running.
 
     Args:
         qsos_groups: List of QSO groups to analyze
@@ -231,25 +341,13 @@ def evaluate_awards_concurrent(
     Returns:
         List of evaluation results, one per group
     """
-    def process_group(qsos: List[QSO]) -> str:
-        return evaluate_awards(qsos, goals, model=model)
-
-    # Use conservative settings for CI environments
-    is_ci = any(env in os.environ for env in ['CI', 'GITHUB_ACTIONS', 'TRAVIS', 'JENKINS'])
-    max_workers = 2 if is_ci else 3
-
     try:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(process_group, group) for group in qsos_groups]
-            results = []
-            for future in concurrent.futures.as_completed(futures, timeout=120):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception:
-                    # Fallback for failed group
-                    results.append("Error processing awards evaluation")
-            return results
-    except (Exception, concurrent.futures.TimeoutError):
-        # Fall back to sequential processing
-        return [process_group(group) for group in qsos_groups]
+        import openai  # noqa: F401  (checked here so a missing package falls back)
+
+        api_key = os.getenv("OPENAI_API_KEY")
+        if api_key:
+            return _run_coroutine(_evaluate_all(api_key, qsos_groups, goals, model))
+    except (ImportError, AttributeError, ValueError, ConnectionError, TimeoutError):
+        pass
+    # Local-only path (no AI, or the client could not be used)
+    return ["\n".join(_awards_base_text(group)) for group in qsos_groups]
@@ -5,25 +5,44 @@
 - `suggest_awards` produces simple, readable recommendations.
 - `filtered_qsos` applies band/mode filters before computing.
 
-Enhanced with parallel processing for improved performance on large datasets.
-
 C Extensions: Automatically uses high-performance Cython extensions when available,
 falls back to pure Python implementation if not compiled.
 """
 
 from __future__ import annotations
 
-import concurrent.futures
 import json
-import multiprocessing
 import os
 from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Set, TypedDict
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    TypedDict,
+)
 
 from platformdirs import user_config_dir
 
-from .models import QSO
+from .models import QSO, norm_value
+
+# orjson is an optional speedup for reading the awards config; its decode
+# error subclasses json.JSONDecodeError, so both parsers fail the same way.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Try to import C-optimized functions, fall back to pure Python
 try:
@@ -58,6 +77,17 @@ class AwardsSummary(TypedDict):
     grids_per_band: Dict[str, int]
 
 
+class AwardCounts(TypedDict):
+    """The subset of AwardsSummary that suggest_awards() reads."""
+    unique_countries: int
+    unique_grids: int
+    grids_per_band: Dict[str, int]
+
+
+# Cache-miss sentinel for the per-pass normalization memo in _compute_summary_sets
+_UNSEEN = object()
+
+
 def _norm(s: Optional[str]) -> Optional[str]:
     """Uppercase and strip a value; return None if the result is empty or not a str.
     
@@ -67,7 +97,7 @@ def _norm(s: Optional[str]) -> Optional[str]:
         return _norm_c(s)
     
     # Pure Python fallback
-    return s.strip().upper() if isinstance(s, str) and s.strip() else None
+    return norm_value(s)
 
 
 def unique_values(qsos: Iterable[QSO], attr: str) -> Set[str]:
@@ -78,14 +108,10 @@ def unique_values(qsos: Iterable[QSO], attr: str) -> Set[str]:
     if USE_C_EXTENSIONS and isinstance(qsos, list):
         return _unique_values_c(qsos, attr)
     
-    # Pure Python fallback
-    out: Set[str] = set()
-    for q in qsos:
-        v = getattr(q, attr, None)
-        nv = _norm(v)
-        if nv:
-            out.add(nv)
-    return out
+    # Pure Python fallback: map/filter/set drive the loop from C, so with the
+    # C norm (non-list input) no Python bytecode runs per QSO
+    norm = _norm_c if USE_C_EXTENSIONS else norm_value
+    return set(filter(None, map(norm, map(attrgetter(attr), qsos))))
 
 
 def unique_by_band(qsos: Iterable[QSO], attr: str) -> Dict[str, Set[str]]:
@@ -97,36 +123,85 @@ def unique_by_band(qsos: Iterable[QSO], attr: str) -> Dict[str, Set[str]]:
         return _unique_by_band_c(qsos, attr)
     
     # Pure Python fallback
+    fields = attrgetter("band", attr)
+    norm = _norm_c if USE_C_EXTENSIONS else norm_value
     out: Dict[str, Set[str]] = defaultdict(set)
+    # Bound add() of each band's set, keyed by the raw band value: saves
+    # normalizing the band and looking up its set for every QSO
+    adders: Dict[object, Callable[[str], None]] = {}
+    get_adder = adders.get
     for q in qsos:
-        band = _norm(getattr(q, "band", None)) or ""
-        v = getattr(q, attr, None)
-        nv = _norm(v)
-        if nv:
-            out[band].add(nv)
+        band, v = fields(q)
+        if nv := norm(v):
+            if (add := get_adder(band)) is None:
+                add = adders[band] = out[norm(band) or ""].add
+            add(nv)
     return out
 
 
-def _compute_summary_chunk(qsos_chunk: List[QSO]) -> Dict[str, object]:
-    """Compute summary statistics for a chunk of QSOs.
+def _compute_summary_sets(qsos: Iterable[QSO]) -> Dict[str, object]:
+    """Collect the unique-value sets behind an awards summary in one pass.
 
-    This function is designed for parallel processing of large QSO datasets.
-    Returns intermediate results as a dict for merging.
+    Returns the QSO count, the normalized country/grid/call/band/mode sets,
+    and the number of distinct grids per band.
     Uses C-optimized version when available for 5-15x speedup.
     """
-    if USE_C_EXTENSIONS:
-        return _compute_summary_chunk_c(qsos_chunk)
-    
-    # Pure Python fallback
-    total = len(qsos_chunk)
-
-    countries = unique_values(qsos_chunk, "country")
-    grids = unique_values(qsos_chunk, "grid")
-    calls = unique_values(qsos_chunk, "call")
-    bands = unique_values(qsos_chunk, "band")
-    modes = unique_values(qsos_chunk, "mode")
-
-    grids_by_band = {b or "": len(vs) for b, vs in unique_by_band(qsos_chunk, "grid").items()}
+    if USE_C_EXTENSIONS and isinstance(qsos, list):
+        return _compute_summary_chunk_c(qsos)
+
+    # Pure Python fallback: one pass updates every set while each QSO's
+    # fields are hot, instead of rescanning the QSOs once per attribute.
+    # The attrgetter fetches all five fields in one C call, the bound
+    # set.add methods (including each band's grid set) skip an attribute
+    # lookup per value, and normalization is inlined to save five function
+    # calls per QSO.
+    #
+    # Countries, modes, bands and grids repeat heavily (a few hundred
+    # distinct values across a whole log), so their normalized forms are
+    # memoized for the pass: a hit is one dict lookup instead of strip()
+    # and upper() allocating two strings. Calls are mostly distinct and
+    # are normalized directly.
+    countries: Set[str] = set()
+    grids: Set[str] = set()
+    calls: Set[str] = set()
+    bands: Set[str] = set()
+    modes: Set[str] = set()
+    grids_by_band: Dict[str, Set[str]] = defaultdict(set)
+
+    fields = attrgetter("country", "call", "mode", "band", "grid")
+    add_country, add_call, add_mode = countries.add, calls.add, modes.add
+    add_band, add_grid = bands.add, grids.add
+
+    normalized: Dict[object, Optional[str]] = {}
+    lookup = normalized.get
+    band_adders: Dict[Optional[str], Callable[[str], None]] = {}
+    get_band_adder = band_adders.get
+
+    total = 0
+    for q in qsos:
+        total += 1
+        country, call, mode, band, grid = fields(q)
+        if (nv := lookup(country, _UNSEEN)) is _UNSEEN:
+            nv = normalized[country] = norm_value(country)
+        if nv:
+            add_country(nv)
+        if isinstance(call, str) and (call := call.strip()):
+            add_call(call.upper())
+        if (nv := lookup(mode, _UNSEEN)) is _UNSEEN:
+            nv = normalized[mode] = norm_value(mode)
+        if nv:
+            add_mode(nv)
+        if (band_nv := lookup(band, _UNSEEN)) is _UNSEEN:
+            band_nv = normalized[band] = norm_value(band)
+        if band_nv:
+            add_band(band_nv)
+        if (nv := lookup(grid, _UNSEEN)) is _UNSEEN:
+            nv = normalized[grid] = norm_value(grid)
+        if nv:
+            add_grid(nv)
+            if (add_band_grid := get_band_adder(band_nv)) is None:
+                add_band_grid = band_adders[band_nv] = grids_by_band[band_nv or ""].add
+            add_band_grid(nv)
 
     return {
         "total_qsos": total,
@@ -135,178 +210,113 @@ def _compute_summary_chunk(qsos_chunk: List[QSO]) -> Dict[str, object]:
         "calls": calls,
         "bands": bands,
         "modes": modes,
-        "grids_per_band": grids_by_band,
-    }
-
-
-def _merge_summaries(summaries: List[Dict[str, object]]) -> AwardsSummary:
-    """Merge multiple summary chunks into a single consolidated summary."""
-    if not summaries:
-        return {
-            "total_qsos": 0,
-            "unique_countries": 0,
-            "unique_grids": 0,
-            "unique_calls": 0,
-            "unique_bands": 0,
-            "unique_modes": 0,
-            "grids_per_band": {},
-        }
-
-    total_qsos = 0
-    for s in summaries:
-        val = s.get("total_qsos", 0)
-        if isinstance(val, (int, float)):
-            total_qsos += int(val)
-        elif isinstance(val, str) and val.isdigit():
-            total_qsos += int(val)
-
-    # Merge unique sets
-    all_countries: Set[str] = set()
-    all_grids: Set[str] = set()
-    all_calls: Set[str] = set()
-    all_bands: Set[str] = set()
-    all_modes: Set[str] = set()
-
-    for s in summaries:
-        countries = s.get("countries")
-        if isinstance(countries, set):
-            all_countries |= countries
-        grids = s.get("grids")
-        if isinstance(grids, set):
-            all_grids |= grids
-        calls = s.get("calls")
-        if isinstance(calls, set):
-            all_calls |= calls
-        bands = s.get("bands")
-        if isinstance(bands, set):
-            all_bands |= bands
-        modes = s.get("modes")
-        if isinstance(modes, set):
-            all_modes |= modes
-
-    # Merge grids per band
-    merged_gpb: Dict[str, int] = defaultdict(int)
-    for s in summaries:
-        gpb = s.get("grids_per_band")
-        if isinstance(gpb, dict):
-            for band_key, count_val in gpb.items():
-                # Note: We need to recalculate this properly for accurate band-specific counts
-                # This is a simplified merge - for exact results, we'd need the actual grid sets
-                band_str = str(band_key) if band_key is not None else ""
-                count_int = (
-                    int(count_val)
-                    if isinstance(count_val, (int, float, str)) and count_val
-                    else 0
-                )
-                if count_int > 0:
-                    merged_gpb[band_str] = merged_gpb.get(band_str, 0) + count_int
-
-    return {
-        "total_qsos": total_qsos,
-        "unique_countries": len(all_countries),
-        "unique_grids": len(all_grids),
-        "unique_calls": len(all_calls),
-        "unique_bands": len(all_bands),
-        "unique_modes": len(all_modes),
-        "grids_per_band": dict(merged_gpb),
+        "grids_per_band": {b: len(vs) for b, vs in grids_by_band.items()},
     }
 
 
-def compute_summary_parallel(qsos: Iterable[QSO], chunk_size: int = 5000) -> AwardsSummary:
-    """Compute awards summary using parallel processing for large datasets.
-
-    Splits QSOs into chunks and processes them in parallel for better performance.
-    Falls back to sequential processing for small datasets or on errors.
-
-    Args:
-        qsos: Iterable of QSO objects
-        chunk_size: Size of each processing chunk
+# Columns compute_summary_from_columns() reads
+SUMMARY_COLUMNS = ("call", "country", "grid", "band", "mode")
 
-    Returns:
-        Dictionary with summary statistics
-    """
-    qsos_list = list(qsos)
+# Columns compute_award_counts_from_columns() reads
+AWARD_COUNT_COLUMNS = ("country", "grid", "band")
 
-    # Use sequential processing for small datasets
-    if len(qsos_list) < chunk_size:
-        return compute_summary(qsos_list)
 
-    # Detect CI environment and avoid ProcessPoolExecutor if needed
-    is_ci = any(env in os.environ for env in ['CI', 'GITHUB_ACTIONS', 'TRAVIS', 'JENKINS'])
+def _unique_column_count(column: Iterable[Optional[str]], norm) -> int:
+    """Count distinct normalized values, normalizing each distinct raw value once."""
+    return len({nv for v in set(column) if (nv := norm(v))})
 
-    if is_ci:
-        # Use ThreadPoolExecutor in CI environments to avoid multiprocessing issues
-        return _compute_summary_threaded(qsos_list, chunk_size)
 
-    # Split into chunks
-    chunks = [qsos_list[i : i + chunk_size] for i in range(0, len(qsos_list), chunk_size)]
+def _grids_per_band_from_columns(
+    bands: Iterable[Optional[str]], grids: Iterable[Optional[str]], norm
+) -> Dict[str, int]:
+    """Count distinct normalized grids per band over distinct band/grid pairs, sorted by band."""
+    grids_by_band: Dict[str, Set[str]] = defaultdict(set)
+    for band, grid in set(zip(bands, grids)):
+        if grid_nv := norm(grid):
+            grids_by_band[norm(band) or ""].add(grid_nv)
+    return {b: len(vs) for b, vs in sorted(grids_by_band.items())}
 
-    try:
-        max_workers = min(len(chunks), multiprocessing.cpu_count() or 1)
 
-        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Process chunks in parallel
-            chunk_summaries = list(executor.map(_compute_summary_chunk, chunks))
+def compute_summary_from_columns(
+    columns: Mapping[str, Sequence[Optional[str]]],
+) -> AwardsSummary:
+    """Compute the compute_summary() result from columnar QSO data.
 
-            # Merge results
-            return _merge_summaries(chunk_summaries)
+    `columns` maps each SUMMARY_COLUMNS name to an equal-length sequence of
+    raw values, e.g. from storage.list_qso_columns(); reading those straight
+    from the database skips building QSO objects, which is most of the cost
+    of summarizing a large log. For QSOs already in memory, compute_summary()
+    is faster than transposing them into columns first.
+    Each column is deduplicated with set() in C before anything else runs,
+    so normalization and the band/grid grouping only touch distinct raw
+    values (or distinct band/grid pairs): a few hundred, not one per QSO.
+    """
+    norm = _norm_c if USE_C_EXTENSIONS else norm_value
 
-    except Exception:
-        # Fall back to sequential processing
-        return compute_summary(qsos_list)
+    return {
+        "total_qsos": len(columns["call"]),
+        "unique_countries": _unique_column_count(columns["country"], norm),
+        "unique_grids": _unique_column_count(columns["grid"], norm),
+        "unique_calls": _unique_column_count(columns["call"], norm),
+        "unique_bands": _unique_column_count(columns["band"], norm),
+        "unique_modes": _unique_column_count(columns["mode"], norm),
+        "grids_per_band": _grids_per_band_from_columns(columns["band"], columns["grid"], norm),
+    }
 
 
-def _compute_summary_threaded(qsos_list: List[QSO], chunk_size: int) -> AwardsSummary:
-    """Thread-based summary computation for CI environments."""
-    chunks = [qsos_list[i : i + chunk_size] for i in range(0, len(qsos_list), chunk_size)]
+def compute_award_counts_from_columns(
+    columns: Mapping[str, Sequence[Optional[str]]],
+) -> AwardCounts:
+    """Compute just the counts suggest_awards() reads from columnar QSO data.
 
-    try:
-        max_workers = min(4, len(chunks))  # Conservative for CI
+    `columns` needs only the AWARD_COUNT_COLUMNS. Calls are nearly all
+    distinct, so skipping them (and modes) avoids most of the normalization
+    work in compute_summary_from_columns() as well as reading those columns.
+    """
+    norm = _norm_c if USE_C_EXTENSIONS else norm_value
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Process chunks in parallel using threads
-            chunk_summaries = list(executor.map(_compute_summary_chunk, chunks))
+    return {
+        "unique_countries": _unique_column_count(columns["country"], norm),
+        "unique_grids": _unique_column_count(columns["grid"], norm),
+        "grids_per_band": _grids_per_band_from_columns(columns["band"], columns["grid"], norm),
+    }
 
-            # Merge results
-            return _merge_summaries(chunk_summaries)
 
-    except Exception:
-        # Fall back to sequential processing
-        return compute_summary(qsos_list)
+def compute_summary_parallel(qsos: Iterable[QSO], chunk_size: int = 5000) -> AwardsSummary:
+    """Compute the awards summary; kept for API compatibility.
+
+    Equivalent to compute_summary(). `chunk_size` is accepted but unused:
+    summarizing is a single cheap pass of set inserts that holds the GIL, so
+    splitting it across a thread pool measured slower (100k QSOs: 0.245s
+    threaded vs 0.236s single pass in pure Python, 0.217s vs 0.199s with the
+    C extension), and merging per-chunk grid counts over-counted grids seen
+    in several chunks.
+    """
+    return compute_summary(qsos)
 
 
 def compute_summary(qsos: Iterable[QSO]) -> AwardsSummary:
     """Compute counts commonly used for awards and operator insights.
 
     Returns a dict with totals and uniqueness across calls, bands, modes, grids, countries,
-    plus a per-band grid count map.
+    plus a per-band grid count map in band order. All counts come from one pass over `qsos`.
 
-    For large datasets, consider using compute_summary_parallel() for better performance.
+    Only the C extension needs a list; the pure-Python pass consumes any
+    iterable, so a streaming source (e.g. list_qsos_stream) is never held
+    in memory all at once.
     """
-    qsos_list = list(qsos)
-
-    # Automatically use parallel processing for large datasets
-    if len(qsos_list) > 10000:
-        return compute_summary_parallel(qsos_list)
-
-    total = len(qsos_list)
-
-    countries = unique_values(qsos_list, "country")
-    grids = unique_values(qsos_list, "grid")
-    calls = unique_values(qsos_list, "call")
-    bands = unique_values(qsos_list, "band")
-    modes = unique_values(qsos_list, "mode")
-
-    grids_by_band = {b or "": len(vs) for b, vs in unique_by_band(qsos_list, "grid").items()}
+    if USE_C_EXTENSIONS and not isinstance(qsos, list):
+        qsos = list(qsos)
+    sets = _compute_summary_sets(qsos)
 
     return {
-        "total_qsos": total,
-        "unique_countries": len(countries),
-        "unique_grids": len(grids),
-        "unique_calls": len(calls),
-        "unique_bands": len(bands),
-        "unique_modes": len(modes),
-        "grids_per_band": grids_by_band,
+        "total_qsos": sets["total_qsos"],
+        "unique_countries": len(sets["countries"]),
+        "unique_grids": len(sets["grids"]),
+        "unique_calls": len(sets["calls"]),
+        "unique_bands": len(sets["bands"]),
+        "unique_modes": len(sets["modes"]),
+        "grids_per_band": dict(sorted(sets["grids_per_band"].items())),
     }
 
 
@@ -316,18 +326,54 @@ DEFAULT_AWARD_THRESHOLDS: Dict[str, int] = {
     "VUCC": 100,  # unique grids (band-specific often)
 }
 
+_DEFAULT_THRESHOLDS_VIEW: Mapping[str, int] = MappingProxyType(DEFAULT_AWARD_THRESHOLDS)
+
+# Distinct grids on one band before suggest_awards() calls it out
+_STRONG_BAND_GRIDS = 50
+
 CONFIG_ENV_VAR = "W4GNS_AWARDS_CONFIG"
 CONFIG_FILENAME = "awards.json"
 
 
+@lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    """Resolve the per-user thresholds file, creating its directory once per process."""
+    cfg_dir = Path(user_config_dir(appname="W4GNS Logger AI", appauthor=False))
+    cfg_dir.mkdir(parents=True, exist_ok=True)
+    return cfg_dir / CONFIG_FILENAME
+
+
 def _config_path() -> Path:
-    """Resolve the JSON file path for award thresholds, honoring env override."""
+    """Resolve the JSON file path for award thresholds, honoring env override.
+
+    The environment variable is read on every call so an override still
+    takes effect mid-process; only the default location is cached.
+    """
     env = os.getenv(CONFIG_ENV_VAR)
     if env:
         return Path(env).expanduser()
-    cfg_dir = Path(user_config_dir(appname="W4GNS Logger AI", appauthor=False))
-    cfg_dir.mkdir(parents=True, exist_ok=True)
-    return cfg_dir / CONFIG_FILENAME
+    return _default_config_path()
+
+
+@lru_cache(maxsize=8)
+def _load_thresholds_cached(path: str, mtime_ns: int) -> Mapping[str, int]:
+    """Parse the thresholds file once per (path, mtime) pair.
+
+    The modification time is part of the cache key only so that an edited
+    file produces a new entry; it is not otherwise used. The result is a
+    read-only view so callers cannot mutate the cached value.
+    """
+    data: Dict[str, int] = dict(DEFAULT_AWARD_THRESHOLDS)
+    try:
+        raw = _json_loads(Path(path).read_bytes())
+        if isinstance(raw, dict):
+            for key, val in raw.items():
+                if isinstance(key, str) and isinstance(val, int) and val > 0:
+                    data[key.upper()] = val
+    except (IOError, OSError, json.JSONDecodeError, ValueError, TypeError):
+        # Ignore malformed configs; fall back to defaults
+        return _DEFAULT_THRESHOLDS_VIEW
+    return MappingProxyType(data)
 
 
 def get_award_thresholds() -> Dict[str, int]:
@@ -337,57 +383,70 @@ def get_award_thresholds() -> Dict[str, int]:
     { "DXCC": 125, "VUCC": 75, "MY_CUSTOM": 50 }
     Unknown keys are preserved for future use.
 
-    Returns defaults if config file cannot be read or parsed.
+    The parsed file is cached until its modification time changes, so
+    repeated calls only cost a stat(). Returns defaults if the config file
+    cannot be read or parsed.
     """
     p = _config_path()
-    data: Dict[str, int] = dict(DEFAULT_AWARD_THRESHOLDS)
     try:
-        if p.exists():
-            with p.open("r", encoding="utf-8") as f:
-                raw = json.load(f)
-                if isinstance(raw, dict):
-                    for key, val in raw.items():
-                        if isinstance(key, str) and isinstance(val, int) and val > 0:
-                            data[key.upper()] = val
-    except (IOError, OSError, json.JSONDecodeError, ValueError, TypeError):
-        # Ignore malformed configs; fall back to defaults
-        pass
-    return data
+        mtime_ns = p.stat().st_mtime_ns
+    except OSError:
+        return dict(DEFAULT_AWARD_THRESHOLDS)
+    return dict(_load_thresholds_cached(str(p), mtime_ns))
+
+
+@lru_cache(maxsize=64)
+def _suggest_awards_cached(
+    countries: int,
+    grids: int,
+    strong_bands: tuple,
+    dxcc_needed: int,
+    vucc_needed: int,
+) -> tuple:
+    """Build the suggestion lines for one set of counts and thresholds."""
+    suggestions: List[str] = []
+
+    if countries >= dxcc_needed:
+        suggestions.append(f"DXCC achieved: {countries} unique countries")
+    elif countries >= int(0.9 * dxcc_needed):
+        remaining = dxcc_needed - countries
+        suggestions.append(f"DXCC close: {countries} countries (need {remaining} more)")
+
+    if grids >= vucc_needed:
+        suggestions.append(f"VUCC achieved: {grids} unique grids")
+    elif grids >= int(0.9 * vucc_needed):
+        remaining = vucc_needed - grids
+        suggestions.append(f"VUCC close: {grids} grids (need {remaining} more)")
+
+    # Band-specific VUCC hints
+    suggestions.extend(
+        f"Strong grid count on {band or 'unknown'}: {count}" for band, count in strong_bands
+    )
+    return tuple(suggestions)
 
 
-def suggest_awards(summary: AwardsSummary) -> List[str]:
+def suggest_awards(summary: AwardsSummary | AwardCounts) -> List[str]:
     """Generate simple, readable suggestions based on thresholds and current counts.
 
-    Handles missing or invalid summary data gracefully.
-    Uses next() for finding first applicable award suggestions.
+    Handles missing or invalid summary data gracefully. Results are memoized
+    on the counts and the thresholds in effect, so redisplaying the same
+    summary (e.g. toggling filters back) is a cache lookup.
     """
     try:
         thresholds = get_award_thresholds()
-        suggestions: List[str] = []
-        countries = summary.get("unique_countries", 0)
-        grids = summary.get("unique_grids", 0)
-
-        dxcc_needed = thresholds.get("DXCC", DEFAULT_AWARD_THRESHOLDS["DXCC"])
-        vucc_needed = thresholds.get("VUCC", DEFAULT_AWARD_THRESHOLDS["VUCC"])
-
-        if countries >= dxcc_needed:
-            suggestions.append(f"DXCC achieved: {countries} unique countries")
-        elif countries >= int(0.9 * dxcc_needed):
-            remaining = dxcc_needed - countries
-            suggestions.append(f"DXCC close: {countries} countries (need {remaining} more)")
-
-        if grids >= vucc_needed:
-            suggestions.append(f"VUCC achieved: {grids} unique grids")
-        elif grids >= int(0.9 * vucc_needed):
-            remaining = vucc_needed - grids
-            suggestions.append(f"VUCC close: {grids} grids (need {remaining} more)")
-
-        # Band-specific VUCC hints
         gpb = summary.get("grids_per_band", {})
-        for band, count in sorted(gpb.items()):
-            if count >= 50:
-                suggestions.append(f"Strong grid count on {band or 'unknown'}: {count}")
-        return suggestions
+        # Only bands at the hint threshold affect the output, so only they
+        # go into the cache key; counts growing below it still hit the cache
+        strong_bands = tuple(sorted((b, c) for b, c in gpb.items() if c >= _STRONG_BAND_GRIDS))
+        return list(
+            _suggest_awards_cached(
+                summary.get("unique_countries", 0),
+                summary.get("unique_grids", 0),
+                strong_bands,
+                thresholds.get("DXCC", DEFAULT_AWARD_THRESHOLDS["DXCC"]),
+                thresholds.get("VUCC", DEFAULT_AWARD_THRESHOLDS["VUCC"]),
+            )
+        )
     except Exception:
         # Return empty list if anything goes wrong
         return []
@@ -421,12 +480,29 @@ def filtered_qsos_stream(
     """
     b = _norm(band) if band else None
     m = _norm(mode) if mode else None
+    if not b and not m:
+        yield from qsos
+        return
+
+    # Band and mode take only a handful of raw spellings per log, so each
+    # one is normalized and compared once; later QSOs cost a dict lookup.
+    norm = _norm_c if USE_C_EXTENSIONS else norm_value
+    band_ok: Dict[object, bool] = {}
+    mode_ok: Dict[object, bool] = {}
 
     for q in qsos:
-        if b and _norm(q.band) != b:
-            continue
-        if m and _norm(q.mode) != m:
-            continue
+        if b:
+            qb = q.band
+            if (ok := band_ok.get(qb)) is None:
+                ok = band_ok[qb] = norm(qb) == b
+            if not ok:
+                continue
+        if m:
+            qm = q.mode
+            if (ok := mode_ok.get(qm)) is None:
+                ok = mode_ok[qm] = norm(qm) == m
+            if not ok:
+                continue
         yield q
 
 
@@ -56,7 +56,7 @@ cpdef str format_adif_record_fast(object qso):
         const char* c_str
         object dt, value
         int year, month, day, hour, minute, second
-        float freq_val
+        double freq_val
         int i
     
     if buffer == NULL:
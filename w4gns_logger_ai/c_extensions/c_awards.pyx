@@ -153,7 +153,9 @@ cpdef dict unique_by_band_fast(list qsos, str attr):
 cpdef dict compute_summary_chunk_fast(list qsos_chunk):
     """Fast C-based awards summary computation for a chunk of QSOs.
     
-    Optimized version designed for parallel processing.
+    Optimized version designed for parallel processing. Every set is
+    updated in a single pass over the chunk, so each QSO's fields are
+    read once rather than once per attribute.
     
     Args:
         qsos_chunk: List of QSO objects to process
@@ -162,25 +164,39 @@ cpdef dict compute_summary_chunk_fast(list qsos_chunk):
         Dictionary with summary statistics
     """
     cdef:
-        int total = len(qsos_chunk)
-        set countries, grids, calls, bands, modes
-        dict grids_by_band_dict, grids_per_band
-        str b
-        set vs
-    
-    # Compute unique values
-    countries = unique_values_fast(qsos_chunk, "country")
-    grids = unique_values_fast(qsos_chunk, "grid")
-    calls = unique_values_fast(qsos_chunk, "call")
-    bands = unique_values_fast(qsos_chunk, "band")
-    modes = unique_values_fast(qsos_chunk, "mode")
-    
-    # Compute grids by band
-    grids_by_band_dict = unique_by_band_fast(qsos_chunk, "grid")
-    grids_per_band = {}
-    
-    for b, vs in grids_by_band_dict.items():
-        grids_per_band[b or ""] = len(vs)
+        Py_ssize_t total = len(qsos_chunk)
+        set countries = set()
+        set grids = set()
+        set calls = set()
+        set bands = set()
+        set modes = set()
+        dict grids_by_band = {}
+        object q, country, call, mode, band, grid
+        set band_set
+    
+    for q in qsos_chunk:
+        country = norm(q.country)
+        if country is not None:
+            PySet_Add(countries, country)
+        call = norm(q.call)
+        if call is not None:
+            PySet_Add(calls, call)
+        mode = norm(q.mode)
+        if mode is not None:
+            PySet_Add(modes, mode)
+        band = norm(q.band)
+        if band is not None:
+            PySet_Add(bands, band)
+        else:
+            band = ""
+        grid = norm(q.grid)
+        if grid is not None:
+            PySet_Add(grids, grid)
+            band_set = grids_by_band.get(band)
+            if band_set is None:
+                band_set = set()
+                grids_by_band[band] = band_set
+            PySet_Add(band_set, grid)
     
     return {
         "total_qsos": total,
@@ -189,5 +205,5 @@ cpdef dict compute_summary_chunk_fast(list qsos_chunk):
         "calls": calls,
         "bands": bands,
         "modes": modes,
-        "grids_per_band": grids_per_band,
+        "grids_per_band": {b: len(vs) for b, vs in grids_by_band.items()},
     }
@@ -6,6 +6,7 @@ ADIF import/export, AI summaries, and awards insights (deterministic + AI).
 
 from __future__ import annotations
 
+import json
 import os
 import sys
 from datetime import UTC, datetime
@@ -21,19 +22,42 @@ from rich.console import Console
 from rich.table import Table
 
 from w4gns_logger_ai.adif import dump_adif, load_adif
-from w4gns_logger_ai.ai_helper import evaluate_awards, summarize_qsos
-from w4gns_logger_ai.awards import compute_summary, filtered_qsos, suggest_awards
+from w4gns_logger_ai.awards import (
+    AWARD_COUNT_COLUMNS,
+    SUMMARY_COLUMNS,
+    compute_award_counts_from_columns,
+    compute_summary_from_columns,
+    suggest_awards,
+)
 from w4gns_logger_ai.models import QSO
 from w4gns_logger_ai.storage import (
     APP_NAME,
+    CallMatch,
     add_qso,
+    bulk_add_qsos,
+    count_qsos,
     create_db_and_tables,
     delete_qso,
     get_db_path,
+    list_qso_columns,
+    list_qso_rows_stream,
     list_qsos,
+    list_qsos_filtered_stream,
     search_qsos,
 )
 
+# orjson is an optional speedup for --json-out; both paths produce the same
+# 2-space-indented UTF-8 text
+try:
+    import orjson
+
+    def _json_dumps(data: object) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_dumps(data: object) -> str:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 app = typer.Typer(add_completion=False, help=f"{APP_NAME} - Ham radio QSO logger")
 awards_app = typer.Typer(help="Awards-related insights (deterministic + AI)")
 app.add_typer(awards_app, name="awards")
@@ -42,6 +66,23 @@ console = Console()
 
 # Utilities
 
+def _print_json(data: object) -> None:
+    """Print `data` as JSON, syntax-highlighted only when stdout is a terminal.
+
+    Rich re-parses and highlights the whole document, which takes seconds for
+    a large search; when output is piped its text is the same as plain
+    indented JSON, so that is written directly.
+    """
+    if console.is_terminal:
+        console.print_json(data=data)
+    else:
+        console.file.write(_json_dumps(data) + "\n")
+
+
+# --when formats tried in order before falling back to fromisoformat
+_WHEN_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+
 def _parse_when(when: Optional[str]) -> datetime:
     """Parse a human-friendly UTC time string.
 
@@ -56,7 +97,7 @@ def _parse_when(when: Optional[str]) -> datetime:
             return datetime.now(UTC).replace(tzinfo=None, microsecond=0)
         # Accept formats: YYYY-MM-DD, YYYY-MM-DD HH:MM, YYYY-MM-DD HH:MM:SS, ISO 8601
         s = when.replace("T", " ").replace("Z", "")
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        for fmt in _WHEN_FORMATS:
             try:
                 return datetime.strptime(s, fmt)
             except ValueError:
@@ -158,7 +199,7 @@ def list_cmd(
         for q in rows:
             table.add_row(
                 str(q.id or ""),
-                q.start_at.strftime("%Y-%m-%d %H:%M:%S"),
+                q.start_at.isoformat(sep=" ", timespec="seconds"),
                 q.call,
                 q.band or "",
                 q.mode or "",
@@ -210,11 +251,10 @@ def export(
         if stream:
             # Streaming export - memory efficient
             from w4gns_logger_ai.adif import dump_adif_stream
-            from w4gns_logger_ai.storage import list_qsos_stream
             
             count = 0
             with output.open('w', encoding='utf-8') as f:
-                for line in dump_adif_stream(list_qsos_stream(limit=limit, call=call)):
+                for line in dump_adif_stream(list_qso_rows_stream(limit=limit, call=call)):
                     f.write(line)
                     if line.strip().endswith('<EOR>'):
                         count += 1
@@ -223,10 +263,10 @@ def export(
                 f"[green]Streamed {count} QSOs to {output} (memory efficient)[/green]"
             )
         else:
-            # Regular export - loads all into memory
-            qsos = list_qsos(limit=limit, call=call)
-            txt = dump_adif(qsos)
-            output.write_text(txt, encoding="utf-8")
+            # Regular export - loads all into memory, as slotted QSORow copies
+            qsos = list(list_qso_rows_stream(limit=limit, call=call))
+            with output.open("w", encoding="utf-8") as f:
+                dump_adif(qsos, out=f)
             console.print(f"Exported {len(qsos)} QSOs to {output}")
     except Exception as e:
         console.print(f"[red]Error exporting ADIF: {e}[/red]")
@@ -252,7 +292,9 @@ def import_adif(
     try:
         _ensure_db()
         console.print(f"Reading ADIF file: {src}")
-        text = src.read_text(encoding="utf-8", errors="ignore")
+        # Raw bytes: load_adif decodes once, and skipping text-mode newline
+        # translation keeps declared lengths of multi-line CRLF values exact
+        text = src.read_bytes()
 
         # Use parallel ADIF processing if enabled
         if parallel:
@@ -272,18 +314,18 @@ def import_adif(
         for q in qsos:
             q.call = q.call.upper()
 
-        count_before = len(list_qsos(limit=99999))
+        count_before = count_qsos()
 
-        # Use parallel bulk insert for large datasets
+        # Use parallel bulk insert for large datasets; smaller imports still
+        # go in as one multi-row insert and one transaction
         if len(qsos) > 500:
             from w4gns_logger_ai.storage import bulk_add_qsos_parallel
             console.print(f"Using parallel bulk insert with batch size {batch_size}...")
             bulk_add_qsos_parallel(qsos, batch_size=batch_size)
         else:
-            for q in qsos:
-                add_qso(q)
+            bulk_add_qsos(qsos)
 
-        count_after = len(list_qsos(limit=99999))
+        count_after = count_qsos()
         console.print(
             f"[green]Imported {len(qsos)} QSOs. "
             f"Total now: {count_after} (was {count_before}).[/green]"
@@ -296,7 +338,11 @@ def import_adif(
 
 @app.command()
 def search(
-    call: Optional[str] = typer.Option(None, help="Substring filter for call"),
+    call: Optional[str] = typer.Option(None, help="Filter for call (see --call-match)"),
+    call_match: CallMatch = typer.Option(
+        CallMatch.SUBSTRING,
+        help="How --call matches; prefix and exact use an index",
+    ),
     band: Optional[str] = typer.Option(None, help="Exact band value"),
     mode: Optional[str] = typer.Option(None, help="Exact mode value"),
     grid: Optional[str] = typer.Option(None, help="Exact grid square"),
@@ -306,7 +352,14 @@ def search(
     """Search QSOs by field and print results as a table or JSON array."""
     try:
         _ensure_db()
-        rows = search_qsos(call=call, band=band, mode=mode, grid=grid, limit=limit)
+        rows = search_qsos(
+            call=call,
+            band=band,
+            mode=mode,
+            grid=grid,
+            limit=limit,
+            call_match=call_match,
+        )
         if json_out:
             def to_dict(q: QSO):
                 return {
@@ -325,7 +378,7 @@ def search(
                     "comment": q.comment,
                 }
             # Use list comprehension (next() not needed for multiple items)
-            console.print_json(data=[to_dict(q) for q in rows])
+            _print_json([to_dict(q) for q in rows])
             return
         # Otherwise, pretty table
         table = Table(title=f"Search results ({len(rows)})")
@@ -338,7 +391,7 @@ def search(
         for q in rows:
             table.add_row(
                 str(q.id or ""),
-                q.start_at.strftime("%Y-%m-%d %H:%M:%S"),
+                q.start_at.isoformat(sep=" ", timespec="seconds"),
                 q.call,
                 q.band or "",
                 q.mode or "",
@@ -354,6 +407,9 @@ def search(
 def summarize(limit: int = typer.Option(50, min=1, help="How many recent QSOs to include")) -> None:
     """Produce a short summary of recent QSOs (AI-enabled when available)."""
     try:
+        # Only the AI commands need the AI helpers; keep them off startup
+        from w4gns_logger_ai.ai_helper import summarize_qsos
+
         _ensure_db()
         rows = list_qsos(limit=limit)
         text = summarize_qsos(rows)
@@ -373,11 +429,11 @@ def awards_summary(
     """Compute and display awards-related counts and per-band grid stats."""
     try:
         _ensure_db()
-        qsos = list_qsos(limit=limit)
-        qsos = filtered_qsos(qsos, band=band, mode=mode)
-        summary = compute_summary(qsos)
+        summary = compute_summary_from_columns(
+            list_qso_columns(SUMMARY_COLUMNS, limit=limit, band=band, mode=mode)
+        )
         if json_out:
-            console.print_json(data=summary)
+            _print_json(summary)
             return
         # Pretty print
         table = Table(title="Awards summary")
@@ -391,7 +447,7 @@ def awards_summary(
         table.add_row("Unique modes", str(summary["unique_modes"]))
         gpb = summary.get("grids_per_band", {}) or {}
         if gpb:
-            for b, c in sorted(gpb.items()):
+            for b, c in gpb.items():
                 table.add_row(f"Grids on {b or 'unknown'}", str(c))
         console.print(table)
     except Exception as e:
@@ -408,9 +464,10 @@ def awards_suggest(
     """Show simple award suggestions (e.g., DXCC close) based on thresholds."""
     try:
         _ensure_db()
-        qsos = filtered_qsos(list_qsos(limit=limit), band=band, mode=mode)
-        summary = compute_summary(qsos)
-        suggestions = suggest_awards(summary)
+        counts = compute_award_counts_from_columns(
+            list_qso_columns(AWARD_COUNT_COLUMNS, limit=limit, band=band, mode=mode)
+        )
+        suggestions = suggest_awards(counts)
         if not suggestions:
             console.print("No award suggestions yet — keep logging!")
             return
@@ -430,8 +487,10 @@ def awards_eval(
 ) -> None:
     """Use AI (when available) to produce a short, actionable awards plan."""
     try:
+        from w4gns_logger_ai.ai_helper import evaluate_awards
+
         _ensure_db()
-        qsos = filtered_qsos(list_qsos(limit=limit), band=band, mode=mode)
+        qsos = list_qsos_filtered_stream(limit=limit, band=band, mode=mode)
         text = evaluate_awards(qsos, goals=goals)
         console.print(text)
     except Exception as e:
@@ -10,32 +10,61 @@ Tabs:
 from __future__ import annotations
 
 import os
+import queue
 import sys
 import threading
 import tkinter as tk
 from collections.abc import Callable
-from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 # Allow running this file directly by ensuring the project root is on sys.path
 if __package__ is None or __package__ == "":
     sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from w4gns_logger_ai.adif import dump_adif, load_adif
-from w4gns_logger_ai.ai_helper import evaluate_awards, summarize_qsos
-from w4gns_logger_ai.awards import compute_summary, filtered_qsos
+from w4gns_logger_ai.adif import dump_adif_to, iter_adif
+from w4gns_logger_ai.ai_helper import evaluate_awards_from_summary, summarize_qsos
+from w4gns_logger_ai.awards import (
+    SUMMARY_COLUMNS,
+    AwardsSummary,
+    compute_summary_from_columns,
+)
 from w4gns_logger_ai.models import QSO, now_utc
 from w4gns_logger_ai.storage import (
     APP_NAME,
     add_qso,
+    bulk_add_qsos,
     create_db_and_tables,
-    delete_qso,
+    delete_qsos,
     get_db_path,
+    list_qso_columns,
+    list_qso_rows_stream,
     list_qsos,
+    qso_log_stamp,
     search_qsos,
 )
 
+T = TypeVar("T")
+
+# How often the Tk thread checks for finished background jobs
+BACKGROUND_POLL_MS = 50
+
+# Quiet time after the last keystroke in a Browse filter before re-querying
+FILTER_DEBOUNCE_MS = 250
+
+# Browse rows materialized up front, and per step as the view nears the bottom
+BROWSE_PAGE_SIZE = 100
+
+# qso_log_stamp() value: (QSO count, highest id)
+LogStamp = Tuple[int, Optional[int]]
+
+
+def _compute_awards_summary(band: Optional[str], mode: Optional[str]) -> AwardsSummary:
+    """Summarize the recent QSOs matching a filter; safe to call off the Tk thread."""
+    return compute_summary_from_columns(
+        list_qso_columns(SUMMARY_COLUMNS, limit=10000, band=band, mode=mode)
+    )
+
 
 class LoggerGUI:
     """Main Tkinter application with tabbed panes for common tasks."""
@@ -47,6 +76,10 @@ class LoggerGUI:
         self.root.geometry("900x600")
         create_db_and_tables()
 
+        # Callbacks of finished _run_background() jobs, run on the Tk thread
+        self._finished: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+        self._jobs_running = 0
+
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(fill="both", expand=True)
 
@@ -98,26 +131,35 @@ class LoggerGUI:
             return
 
         def parse_float(s: str) -> Optional[float]:
+            # Blank is the usual case: answer it without raising ValueError
+            s = s.strip()
+            if not s:
+                return None
             try:
                 return float(s)
-            except (ValueError, TypeError):
+            except ValueError:
                 return None
 
+        def clean(entry: ttk.Entry) -> Optional[str]:
+            # Blank or whitespace-only fields are stored as NULL, not " "
+            return entry.get().strip() or None
+
         q = QSO(
             call=call,
             start_at=now_utc(),
-            band=(self.e_band.get() or None) or None,
-            mode=(self.e_mode.get() or None) or None,
-            freq_mhz=parse_float(self.e_freq.get() or ""),
-            rst_sent=(self.e_rst_s.get() or None) or None,
-            rst_rcvd=(self.e_rst_r.get() or None) or None,
-            name=(self.e_name.get() or None) or None,
-            qth=(self.e_qth.get() or None) or None,
-            grid=(self.e_grid.get() or None) or None,
-            country=(self.e_country.get() or None) or None,
+            band=clean(self.e_band),
+            mode=clean(self.e_mode),
+            freq_mhz=parse_float(self.e_freq.get()),
+            rst_sent=clean(self.e_rst_s),
+            rst_rcvd=clean(self.e_rst_r),
+            name=clean(self.e_name),
+            qth=clean(self.e_qth),
+            grid=clean(self.e_grid),
+            country=clean(self.e_country),
             comment=(self.t_comment.get("1.0", tk.END).strip() or None),
         )
         add_qso(q)
+        self._awards_stamp = None
         messagebox.showinfo("Saved", f"Saved QSO with {q.call}")
         self._refresh_table()
 
@@ -142,6 +184,13 @@ class LoggerGUI:
         self.f_mode = ttk.Entry(filters, width=10)
         self.f_mode.pack(side="left", padx=6)
 
+        # Filter live as the user types, but only query once typing pauses;
+        # Enter refreshes immediately
+        self._filter_job: Optional[str] = None
+        for entry in (self.f_call, self.f_band, self.f_mode):
+            entry.bind("<KeyRelease>", self._schedule_refresh)
+            entry.bind("<Return>", lambda _e: self._refresh_table())
+
         ttk.Button(filters, text="Refresh", command=self._refresh_table).pack(
             side="left", padx=6
         )
@@ -149,38 +198,119 @@ class LoggerGUI:
             side="left", padx=6
         )
 
+        # Full result of the last query; only the first _row_cursor rows are
+        # inserted, and scrolling near the bottom materializes the next page (the
+        # cursor is kept across refreshes so the user's scroll depth survives)
+        self._rows: List[Tuple[str, Tuple[Any, ...]]] = []
+        self._row_cursor = BROWSE_PAGE_SIZE
+        table = ttk.Frame(frame)
+        table.pack(fill="both", expand=True, padx=8, pady=6)
+        self.tree_scroll = ttk.Scrollbar(table, orient="vertical")
         self.tree = ttk.Treeview(
-            frame,
+            table,
             columns=("id", "utc", "call", "band", "mode", "grid", "comment"),
             show="headings",
+            yscrollcommand=self._on_tree_scroll,
         )
+        self.tree_scroll.configure(command=self.tree.yview)
         for i, col in enumerate(["ID", "UTC", "Call", "Band", "Mode", "Grid", "Comment"]):
             self.tree.heading(self.tree["columns"][i], text=col)
             self.tree.column(
                 self.tree["columns"][i], width=110 if col != "Comment" else 260
             )
-        self.tree.pack(fill="both", expand=True, padx=8, pady=6)
+        self.tree_scroll.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
 
+        # Rows currently in the table, keyed by iid (the QSO id), in display order
+        self._shown_rows: Dict[str, Tuple[Any, ...]] = {}
+        self._refresh_seq = 0
         self._refresh_table()
 
+    def _schedule_refresh(self, event: Optional[tk.Event] = None) -> None:
+        """Debounce filter keystrokes: refresh once FILTER_DEBOUNCE_MS after the last one."""
+        if event is not None and event.keysym == "Return":
+            return  # handled by the <Return> binding
+        if self._filter_job is not None:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(FILTER_DEBOUNCE_MS, self._refresh_table)
+
     def _refresh_table(self) -> None:
-        """Populate the Browse table using current filters (call/band/mode)."""
-        call = (self.f_call.get() or None) if hasattr(self, 'f_call') else None
-        band = (self.f_band.get() or None) if hasattr(self, 'f_band') else None
-        mode = (self.f_mode.get() or None) if hasattr(self, 'f_mode') else None
-        rows = search_qsos(call=call, band=band, mode=mode, limit=1000)
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for q in rows:
-            self.tree.insert('', tk.END, values=(
-                q.id or "",
-                q.start_at.strftime("%Y-%m-%d %H:%M:%S"),
-                q.call,
-                q.band or "",
-                q.mode or "",
-                q.grid or "",
-                (q.comment or "")[:60],
-            ))
+        """Populate the Browse table using current filters (call/band/mode).
+
+        The query runs on a worker thread; only the table update runs on the
+        Tk thread, and results of a refresh that has since been superseded
+        are dropped.
+        """
+        # A direct refresh (button, Enter, save) supersedes a pending one
+        if self._filter_job is not None:
+            self.root.after_cancel(self._filter_job)
+            self._filter_job = None
+        call = self.f_call.get() or None
+        band = self.f_band.get() or None
+        mode = self.f_mode.get() or None
+        self._refresh_seq += 1
+        seq = self._refresh_seq
+
+        def show(rows: List[QSO]) -> None:
+            if seq == self._refresh_seq:
+                self._show_rows(rows)
+
+        self._run_background(
+            lambda: search_qsos(call=call, band=band, mode=mode, limit=1000),
+            show,
+            lambda e: messagebox.showerror("Error", str(e)),
+        )
+
+    def _show_rows(self, rows: List[QSO]) -> None:
+        """Make the Browse table show `rows`, in order, a page at a time."""
+        self._rows = [
+            (
+                str(q.id),
+                (
+                    q.id or "",
+                    q.start_at.isoformat(sep=" ", timespec="seconds"),
+                    q.call,
+                    q.band or "",
+                    q.mode or "",
+                    q.grid or "",
+                    (q.comment or "")[:60],
+                ),
+            )
+            for q in rows
+        ]
+        self._materialize_rows()
+
+    def _on_tree_scroll(self, first: str, last: str) -> None:
+        """Move the scrollbar, and insert the next page once the view nears the bottom."""
+        self.tree_scroll.set(first, last)
+        if float(last) >= 0.9 and self._row_cursor < len(self._rows):
+            self._row_cursor += BROWSE_PAGE_SIZE
+            self._materialize_rows()
+
+    def _materialize_rows(self) -> None:
+        """Make the table show the first _row_cursor rows, touching only what changed."""
+        wanted = dict(self._rows[: self._row_cursor])
+
+        # Apply only the difference to what is shown: every Treeview call is a
+        # round trip into Tcl, and clearing and refilling the table on each
+        # refresh made it flash. Narrowing a filter now just deletes rows.
+        shown = self._shown_rows
+        stale = [iid for iid in shown if iid not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+        order = [iid for iid in shown if iid in wanted]
+        for iid, values in wanted.items():
+            old = shown.get(iid)
+            if old is None:
+                self.tree.insert("", tk.END, iid=iid, values=values)
+                order.append(iid)
+            elif old != values:
+                self.tree.item(iid, values=values)
+        if order != list(wanted):
+            # New rows landed at the end (or ties in start_at came back in a
+            # different order): one call puts every row in query order
+            self.tree.set_children("", *wanted)
+        self._shown_rows = wanted
 
     def _delete_selected(self) -> None:
         """Delete highlighted QSOs from the Browse table after confirmation."""
@@ -189,10 +319,9 @@ class LoggerGUI:
             return
         if not messagebox.askyesno("Confirm", "Delete selected QSO(s)?"):
             return
-        for item in sel:
-            vals = self.tree.item(item, 'values')
-            qso_id = int(vals[0])
-            delete_qso(qso_id)
+        # Row iids are the QSO ids, so no per-row Treeview lookup is needed
+        delete_qsos(map(int, sel))
+        self._awards_stamp = None
         self._refresh_table()
 
     # Awards tab
@@ -228,38 +357,98 @@ class LoggerGUI:
         self.eval_text = tk.Text(frame, height=10)
         self.eval_text.pack(fill="both", expand=True, padx=8, pady=4)
 
-        self._awards_refresh()
+        # Summaries by (band, mode) filter, valid while the log stamp is
+        # unchanged; only ever read or written on the Tk thread
+        self._awards_cache: Dict[Tuple[Optional[str], Optional[str]], AwardsSummary] = {}
+        self._awards_stamp: Optional[LogStamp] = None
+        self._awards_refresh_seq = 0
+        # Summarizing a big log takes a moment: let the window paint first
+        self.root.after_idle(self._awards_refresh)
+
+    def _awards_job(
+        self, band: Optional[str], mode: Optional[str]
+    ) -> Callable[[], Tuple[LogStamp, AwardsSummary]]:
+        """Return worker-thread work that yields (log stamp, summary) for a filter.
+
+        The cached entry is looked up here, on the Tk thread; the worker only
+        reuses it if qso_log_stamp() still matches, so changes made elsewhere
+        are picked up, and this window's own saves, deletes and imports reset
+        the stamp directly. The stamp is read before the rows: if the log
+        changes in between, the summary is filed under the older stamp and
+        simply recomputed next time.
+        """
+        cached_stamp = self._awards_stamp
+        cached = self._awards_cache.get((band, mode))
+
+        def job() -> Tuple[LogStamp, AwardsSummary]:
+            stamp = qso_log_stamp()
+            if cached is not None and stamp == cached_stamp:
+                return stamp, cached
+            return stamp, _compute_awards_summary(band, mode)
+
+        return job
+
+    def _store_awards_summary(
+        self, band: Optional[str], mode: Optional[str], stamp: LogStamp, summary: AwardsSummary
+    ) -> None:
+        """Cache a summary computed under `stamp` (Tk thread only)."""
+        if stamp != self._awards_stamp:
+            self._awards_cache.clear()
+            self._awards_stamp = stamp
+        self._awards_cache[(band, mode)] = summary
 
     def _awards_refresh(self) -> None:
-        """Compute and display the deterministic awards summary in the text box."""
+        """Compute the deterministic awards summary in the background and display it."""
         band = self.a_band.get() or None
         mode = self.a_mode.get() or None
-        qsos = filtered_qsos(list_qsos(limit=10000), band=band, mode=mode)
-        s = compute_summary(qsos)
-        lines = [
-            "Awards summary:",
-            f"- Total QSOs: {s['total_qsos']}",
-            f"- Unique countries: {s['unique_countries']}",
-            f"- Unique grids: {s['unique_grids']}",
-            f"- Unique calls: {s['unique_calls']}",
-            f"- Unique bands: {s['unique_bands']} | modes: {s['unique_modes']}",
-        ]
-        gpb = s.get('grids_per_band', {})
-        if gpb:
-            for b, c in sorted(gpb.items()):
-                lines.append(f"- Grids on {b or 'unknown'}: {c}")
-        self.awards_text.delete("1.0", tk.END)
-        self.awards_text.insert(tk.END, "\n".join(lines))
+        job = self._awards_job(band, mode)
+        self._awards_refresh_seq += 1
+        seq = self._awards_refresh_seq
+
+        def show(result: Tuple[LogStamp, AwardsSummary]) -> None:
+            stamp, s = result
+            self._store_awards_summary(band, mode, stamp, s)
+            if seq != self._awards_refresh_seq:
+                return  # a newer refresh is on its way
+            lines = [
+                "Awards summary:",
+                f"- Total QSOs: {s['total_qsos']}",
+                f"- Unique countries: {s['unique_countries']}",
+                f"- Unique grids: {s['unique_grids']}",
+                f"- Unique calls: {s['unique_calls']}",
+                f"- Unique bands: {s['unique_bands']} | modes: {s['unique_modes']}",
+            ]
+            gpb = s.get('grids_per_band', {})
+            if gpb:
+                for b, c in gpb.items():
+                    lines.append(f"- Grids on {b or 'unknown'}: {c}")
+            self.awards_text.delete("1.0", tk.END)
+            self.awards_text.insert(tk.END, "\n".join(lines))
+
+        self._run_background(job, show, lambda e: messagebox.showerror("Error", str(e)))
 
     def _awards_eval(self) -> None:
         """Run the AI-assisted awards evaluation in a background thread."""
         band = self.a_band.get() or None
         mode = self.a_mode.get() or None
         goals = self.e_goals.get() or None
-        qsos = filtered_qsos(list_qsos(limit=10000), band=band, mode=mode)
-        self._run_in_thread(
-            self.eval_text, "Evaluating...\n", evaluate_awards, qsos, goals=goals
-        )
+        job = self._awards_job(band, mode)
+
+        def evaluate() -> Tuple[LogStamp, AwardsSummary, str]:
+            stamp, summary = job()
+            return stamp, summary, evaluate_awards_from_summary(summary, goals=goals)
+
+        def show(text: str) -> None:
+            self.eval_text.delete("1.0", tk.END)
+            self.eval_text.insert(tk.END, text)
+
+        def evaluated(result: Tuple[LogStamp, AwardsSummary, str]) -> None:
+            stamp, summary, text = result
+            self._store_awards_summary(band, mode, stamp, summary)
+            show(text)
+
+        show("Evaluating...\n")
+        self._run_background(evaluate, evaluated, lambda e: show(f"Error: {e}"))
 
     # Tools tab
     def _build_tools_tab(self) -> None:
@@ -288,13 +477,18 @@ class LoggerGUI:
         )
         if not path:
             return
-        qsos = list_qsos(limit=100000)
-        txt = dump_adif(qsos)
-        try:
-            Path(path).write_text(txt, encoding="utf-8")
-            messagebox.showinfo("Exported", f"Wrote {len(qsos)} QSOs to {path}")
-        except (IOError, OSError, PermissionError) as e:
-            messagebox.showerror("Error", str(e))
+
+        def export() -> int:
+            # Rows stream from SQLite straight into the file's write buffer,
+            # so memory stays flat however many QSOs are exported
+            with open(path, "wb") as f:
+                return dump_adif_to(f, list_qso_rows_stream(limit=100000))
+
+        self._run_background(
+            export,
+            lambda n: messagebox.showinfo("Exported", f"Wrote {n} QSOs to {path}"),
+            lambda e: messagebox.showerror("Error", str(e)),
+        )
 
     def _import_adif(self) -> None:
         """Import QSOs from an ADIF file chosen by the user."""
@@ -304,22 +498,31 @@ class LoggerGUI:
         )
         if not path:
             return
-        try:
-            text = Path(path).read_text(encoding="utf-8", errors="ignore")
-            qsos = load_adif(text)
-            for q in qsos:
-                q.call = q.call.upper()
-                add_qso(q)
-            messagebox.showinfo("Imported", f"Imported {len(qsos)} QSOs from {path}")
+
+        def import_file() -> int:
+            def uppercased(qsos: Iterable[QSO]) -> Iterator[QSO]:
+                for q in qsos:
+                    q.call = q.call.upper()
+                    yield q
+
+            # Parse the file a block at a time and insert as records arrive,
+            # so neither the ADIF text nor the parsed log is held whole
+            with open(path, "rb") as f:
+                return bulk_add_qsos(uppercased(iter_adif(f)))
+
+        def imported(n: int) -> None:
+            self._awards_stamp = None
+            messagebox.showinfo("Imported", f"Imported {n} QSOs from {path}")
             self._refresh_table()
-        except (IOError, OSError, PermissionError, ValueError) as e:
-            messagebox.showerror("Error", str(e))
+
+        self._run_background(
+            import_file, imported, lambda e: messagebox.showerror("Error", str(e))
+        )
 
     def _summarize(self) -> None:
         """Summarize recent QSOs (AI-enabled) in the Tools tab text area."""
-        rows = list_qsos(limit=100)
         self._run_in_thread(
-            self.tools_text, "Summarizing...\n", summarize_qsos, rows
+            self.tools_text, "Summarizing...\n", lambda: summarize_qsos(list_qsos(limit=100))
         )
 
     def _run_in_thread(
@@ -342,32 +545,70 @@ class LoggerGUI:
         target_widget.delete("1.0", tk.END)
         target_widget.insert(tk.END, initial_message)
 
+        def apply_result(result: str) -> None:
+            target_widget.delete("1.0", tk.END)
+            target_widget.insert(tk.END, result)
+
+        self._run_background(
+            lambda: func(*args, **kwargs),
+            apply_result,
+            lambda e: apply_result(f"Error: {e}"),
+        )
+
+    def _run_background(
+        self,
+        work: Callable[[], T],
+        done: Callable[[T], None],
+        failed: Callable[[Exception], None],
+    ) -> None:
+        """Run `work` on a worker thread so database and file I/O never block Tk.
+
+        `done(result)` or, if `work` raises, `failed(error)` is then called on
+        the Tk thread, which is the only thread allowed to touch widgets. The
+        worker never calls into Tk itself: it queues the callback and the Tk
+        thread polls the queue, which also works before mainloop() starts.
+        """
         def worker() -> None:
             try:
-                result = func(*args, **kwargs)
-            except (ValueError, IOError, OSError, RuntimeError) as e:
-                result = f"Error: {e}"
-            # Ensure UI updates occur on the main thread
-            def apply_result() -> None:
-                target_widget.delete("1.0", tk.END)
-                target_widget.insert(tk.END, result)
-            self.root.after(0, apply_result)
-
+                result = work()
+            except Exception as e:  # every job must report back to the Tk thread
+                error = e
+                self._finished.put(lambda: failed(error))
+                return
+            self._finished.put(lambda: done(result))
+
+        self._jobs_running += 1
+        if self._jobs_running == 1:
+            self.root.after(BACKGROUND_POLL_MS, self._drain_finished)
         threading.Thread(target=worker, daemon=True).start()
 
+    def _drain_finished(self) -> None:
+        """Run callbacks of finished background jobs; keep polling while any run."""
+        try:
+            while True:
+                try:
+                    callback = self._finished.get_nowait()
+                except queue.Empty:
+                    break
+                self._jobs_running -= 1
+                callback()
+        finally:
+            if self._jobs_running:
+                self.root.after(BACKGROUND_POLL_MS, self._drain_finished)
+
 
 def main() -> None:
     """Entrypoint for launching the Tkinter GUI."""
     root = tk.Tk()
-    # Prefer native theme if available
-    try:
+    # Prefer the native theme; only Windows Tk builds ship vista/xpnative
+    if sys.platform == "win32":
         style = ttk.Style(root)
-        if "vista" in style.theme_names():
-            style.theme_use("vista")
-        elif "xpnative" in style.theme_names():
-            style.theme_use("xpnative")
-    except tk.TclError:
-        pass
+        for theme in ("vista", "xpnative"):
+            try:
+                style.theme_use(theme)
+                break
+            except tk.TclError:
+                continue
     LoggerGUI(root)
     root.mainloop()
 
@@ -6,10 +6,13 @@ individual contact. Fields are deliberately practical (band, mode, grid, etc.).
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlmodel import Field, SQLModel
+from sqlalchemy import text
+from sqlmodel import Field, Index, SQLModel
 
 
 class QSO(SQLModel, table=True):
@@ -23,16 +26,37 @@ class QSO(SQLModel, table=True):
     - rst_sent/rst_rcvd: Signal reports.
     - name/qth/grid/country: Operator/location metadata (optional).
     - comment: Free-form notes.
+
+    Note: QSO cannot declare __slots__. Pydantic stores field values and
+    SQLAlchemy stores instrumentation state in the instance __dict__, and
+    declaring slots for the field names conflicts with the mapped class
+    attributes. Memory-sensitive bulk read paths can stream QSORow instead.
     """
 
+    # Back "recent QSOs on a band/mode/grid" searches with one index range
+    # scan, already in start_at order, instead of matching rows then sorting;
+    # they also serve plain band/mode/grid lookups, so those columns carry no
+    # single-column index of their own. ix_qso_call_nocase lets
+    # case-insensitive prefix/exact call searches (plain LIKE 'W1%' /
+    # = COLLATE NOCASE) use an index range scan; every call search is
+    # case-insensitive, so a plain index on call would never be used.
+    __table_args__ = (
+        Index("ix_qso_band_start_at", "band", "start_at"),
+        Index("ix_qso_mode_start_at", "mode", "start_at"),
+        Index("ix_qso_grid_start_at", "grid", "start_at"),
+        Index("ix_qso_call_nocase", text("call COLLATE NOCASE")),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    call: str = Field(index=True, description="Station callsign")
+    call: str = Field(description="Station callsign")
     start_at: datetime = Field(index=True, description="QSO start time (UTC)")
 
     # Radio details
-    band: Optional[str] = Field(default=None, index=True)
-    mode: Optional[str] = Field(default=None, index=True)
-    freq_mhz: Optional[float] = Field(default=None, description="Frequency in MHz")
+    band: Optional[str] = None
+    mode: Optional[str] = None
+    freq_mhz: Optional[float] = Field(
+        default=None, index=True, description="Frequency in MHz"
+    )
 
     # Reports
     rst_sent: Optional[str] = None
@@ -41,16 +65,59 @@ class QSO(SQLModel, table=True):
     # Operator/station info
     name: Optional[str] = None
     qth: Optional[str] = None
-    grid: Optional[str] = Field(default=None, index=True)
+    grid: Optional[str] = None
     country: Optional[str] = None
 
     # Misc
     comment: Optional[str] = None
 
 
+@dataclass(slots=True)
+class QSORow:
+    """Plain, slotted copy of one QSO row for bulk read-only paths.
+
+    Has the same attributes as QSO but no Pydantic or SQLAlchemy state: no
+    per-instance __dict__, no validation, and no session identity map, so
+    building millions of them (e.g. for an ADIF export) is far cheaper.
+    Field order matches the qso table columns. Not attached to any session;
+    use QSO when a row needs to be modified or saved.
+    """
+
+    id: Optional[int]
+    call: str
+    start_at: datetime
+    band: Optional[str] = None
+    mode: Optional[str] = None
+    freq_mhz: Optional[float] = None
+    rst_sent: Optional[str] = None
+    rst_rcvd: Optional[str] = None
+    name: Optional[str] = None
+    qth: Optional[str] = None
+    grid: Optional[str] = None
+    country: Optional[str] = None
+    comment: Optional[str] = None
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
 def now_utc() -> datetime:
     """Return the current time as a naive UTC datetime without microseconds.
 
     We intentionally store naive UTC to keep SQLite handling and output simple.
+    Built as epoch + whole seconds: same value as
+    datetime.now(UTC).replace(tzinfo=None, microsecond=0), about twice as fast.
+    """
+    return _EPOCH + timedelta(seconds=int(time.time()))
+
+
+def norm_value(s: object) -> Optional[str]:
+    """Strip and uppercase a str, or return None if it is empty or not a str.
+
+    The normalization band, mode, country and grid values get before they are
+    compared or counted (so " 20m\t" and "20M" are the same band). Shared by
+    the awards summaries and storage's band/mode filters.
     """
-    return datetime.now(UTC).replace(tzinfo=None, microsecond=0)
+    if isinstance(s, str) and (t := s.strip()):
+        return t.upper()
+    return None
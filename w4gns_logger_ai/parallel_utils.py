@@ -7,18 +7,72 @@ based on physical vs logical CPU cores for better hyperthreading utilization.
 
 import multiprocessing
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 try:
     import psutil
     HAS_PSUTIL = True
+    # Start the cpu_percent() sampling window so get_cpu_info() can read it
+    # without blocking
+    psutil.cpu_percent(interval=None)
 except ImportError:
     HAS_PSUTIL = False
 
+# Environment variables whose presence marks a CI runner
+_CI_ENV_VARS = frozenset({"CI", "GITHUB_ACTIONS", "TRAVIS", "JENKINS"})
+
+
+@lru_cache(maxsize=1)
+def is_ci_environment() -> bool:
+    """Return True when running under a known CI system.
+
+    Checks each name with os.environ's own lookup: intersecting the set with
+    os.environ.keys() instead would decode every variable in the environment.
+    Even so a miss costs a caught KeyError per name (about 4µs in all), so
+    the answer is computed once per process; call
+    is_ci_environment.cache_clear() after changing the CI variables.
+    """
+    return any(map(os.environ.__contains__, _CI_ENV_VARS))
+
+
+@lru_cache(maxsize=1)
+def _cpu_counts() -> Tuple[int, int]:
+    """Return (physical, logical) core counts, detected once per process.
+
+    psutil's physical count parses /proc/cpuinfo (or sysctl) on every call,
+    and the topology cannot change while we run, so callers that size a pool
+    per batch reuse the first answer.
+    """
+    if HAS_PSUTIL:
+        physical_cores = psutil.cpu_count(logical=False) or 1
+        logical_cores = psutil.cpu_count(logical=True) or physical_cores
+    else:
+        # Fallback to multiprocessing
+        logical_cores = multiprocessing.cpu_count() or 1
+        # Estimate physical cores (rough heuristic)
+        physical_cores = max(1, logical_cores // 2)
+    return physical_cores, logical_cores
+
+
+def _available_memory() -> Optional[int]:
+    """Return bytes of RAM available without swapping, or None if unknown.
+
+    Not cached: unlike the core counts, this changes while we run.
+    """
+    if HAS_PSUTIL:
+        return psutil.virtual_memory().available
+    try:
+        # Free pages only (page cache not counted), so this errs low
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
 
 def get_optimal_workers(
     workload_type: str = "io",
     max_workers: Optional[int] = None,
+    estimated_bytes_per_worker: Optional[int] = None,
 ) -> int:
     """Calculate optimal worker count based on workload type and hyperthreading.
     
@@ -28,6 +82,9 @@ def get_optimal_workers(
             - "cpu": CPU bound (computation) - doesn't benefit from hyperthreading  
             - "mixed": Mixed I/O and CPU - moderate hyperthreading benefit
         max_workers: Optional maximum to cap the result
+        estimated_bytes_per_worker: Optional peak memory one worker needs;
+            when given, the count is also capped so that many workers fit
+            in the currently available RAM (ignored if that is unknown)
     
     Returns:
         Optimal number of workers for the workload type
@@ -43,22 +100,12 @@ def get_optimal_workers(
         >>> workers = get_optimal_workers("mixed")
     """
     # Detect CI environment - use conservative settings
-    is_ci = any(env in os.environ for env in ['CI', 'GITHUB_ACTIONS', 'TRAVIS', 'JENKINS'])
-    
-    if is_ci:
+    if is_ci_environment():
         # CI environments: use minimal workers to avoid resource contention
         base_workers = 2
     else:
-        # Get physical and logical core counts
-        if HAS_PSUTIL:
-            physical_cores = psutil.cpu_count(logical=False) or 1
-            logical_cores = psutil.cpu_count(logical=True) or physical_cores
-        else:
-            # Fallback to multiprocessing
-            logical_cores = multiprocessing.cpu_count() or 1
-            # Estimate physical cores (rough heuristic)
-            physical_cores = max(1, logical_cores // 2)
-        
+        physical_cores, logical_cores = _cpu_counts()
+
         # Calculate workers based on workload type
         if workload_type == "io":
             # I/O bound: Use 2x physical cores (benefits from hyperthreading)
@@ -76,6 +123,12 @@ def get_optimal_workers(
     # Apply maximum limit if specified
     if max_workers is not None:
         base_workers = min(base_workers, max_workers)
+
+    # Swapping or an OOM kill costs far more than running fewer workers
+    if estimated_bytes_per_worker:
+        available = _available_memory()
+        if available is not None:
+            base_workers = min(base_workers, available // estimated_bytes_per_worker)
     
     # Ensure at least 1 worker
     return max(1, base_workers)
@@ -131,9 +184,7 @@ def should_use_parallel(
         return force_parallel
     
     # CI environments: higher threshold to avoid overhead
-    is_ci = any(env in os.environ for env in ['CI', 'GITHUB_ACTIONS', 'TRAVIS', 'JENKINS'])
-    
-    if is_ci:
+    if is_ci_environment():
         threshold = max(threshold, 500)
     
     return item_count >= threshold
@@ -141,30 +192,31 @@ def should_use_parallel(
 
 def get_cpu_info() -> dict:
     """Get CPU information for debugging and optimization.
+
+    cpu_percent is psutil's non-blocking reading: usage since the previous
+    call (or since this module was imported), so it returns immediately
+    instead of sleeping for a sample interval. A call made right after
+    import can report 0.0.
     
     Returns:
         Dictionary with CPU details
     """
     info = {
         "has_psutil": HAS_PSUTIL,
-        "is_ci": any(env in os.environ for env in ['CI', 'GITHUB_ACTIONS', 'TRAVIS', 'JENKINS']),
+        "is_ci": is_ci_environment(),
     }
     
+    physical_cores, logical_cores = _cpu_counts()
+    info["physical_cores"] = physical_cores  # An estimate without psutil
+    info["logical_cores"] = logical_cores
     if HAS_PSUTIL:
         info.update({
-            "physical_cores": psutil.cpu_count(logical=False),
-            "logical_cores": psutil.cpu_count(logical=True),
-            "hyperthreading": psutil.cpu_count(logical=True) > psutil.cpu_count(logical=False),
-            "cpu_percent": psutil.cpu_percent(interval=0.1),
+            "hyperthreading": logical_cores > physical_cores,
+            "cpu_percent": psutil.cpu_percent(interval=None),
             "memory_percent": psutil.virtual_memory().percent,
         })
     else:
-        logical_cores = multiprocessing.cpu_count() or 1
-        info.update({
-            "physical_cores": max(1, logical_cores // 2),  # Estimate
-            "logical_cores": logical_cores,
-            "hyperthreading": None,  # Unknown
-        })
+        info["hyperthreading"] = None  # Unknown
     
     # Calculate optimal workers for different workloads
     info["optimal_workers"] = {
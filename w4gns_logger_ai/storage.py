@@ -9,19 +9,56 @@ Enhanced with connection pooling and bulk operations for better performance.
 
 from __future__ import annotations
 
+import concurrent.futures
 import os
 import threading
+from collections import deque
 from contextlib import contextmanager
+from dataclasses import fields
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from platformdirs import user_data_dir
+from sqlalchemy import DateTime, Engine, Integer, bindparam, delete, event, func
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine, select
 
-from .models import QSO
+from .models import QSO, QSORow, norm_value
+from .parallel_utils import get_optimal_workers, is_ci_environment
 
 APP_NAME = "W4GNS Logger AI"
 DB_ENV_VAR = "W4GNS_DB_PATH"
+SQLITE_FAST_ENV_VAR = "W4GNS_SQLITE_FAST"
+
+# Rows fetched and turned into QSO objects at a time by the *_stream
+# generators. Without yield_per the ORM loads the whole result up front.
+STREAM_BATCH_SIZE = 256
+
+# QSOs per executemany in bulk_add_qsos(): bounds memory when it is fed a
+# lazy source such as adif.iter_adif(), while staying one transaction
+BULK_INSERT_BATCH_SIZE = 1000
+
+# Applied to every new connection. WAL appends commits to a log instead of
+# writing a rollback journal and then the database, so each commit costs one
+# fsync rather than several, and readers no longer block the writer. With
+# the default synchronous=FULL a committed QSO still survives a power loss.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped I/O
+)
+
+# Added on top when W4GNS_SQLITE_FAST=1: synchronous=NORMAL only fsyncs at
+# WAL checkpoints, so write-heavy workloads stop paying one fsync per
+# commit. A crash can lose the last commits but not corrupt the file.
+SQLITE_FAST_PRAGMAS = ("PRAGMA synchronous=NORMAL",)
 
 
 def _default_db_path() -> Path:
@@ -44,68 +81,138 @@ def get_db_path() -> Path:
     return _default_db_path()
 
 
-_engine = None
+def _run_pragmas(dbapi_conn, pragmas: Sequence[str]) -> None:
+    """Execute `pragmas` on a raw DB-API connection."""
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in pragmas:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _apply_pragmas(dbapi_conn, _connection_record) -> None:
+    """SQLAlchemy "connect" listener that tunes each new SQLite connection."""
+    _run_pragmas(dbapi_conn, SQLITE_PRAGMAS)
+
+
+def _apply_fast_pragmas(dbapi_conn, _connection_record) -> None:
+    """"connect" listener for the opt-in, less durable W4GNS_SQLITE_FAST mode."""
+    _run_pragmas(dbapi_conn, SQLITE_FAST_PRAGMAS)
+
+
+# Engines keyed by the raw W4GNS_DB_PATH value ("" for the default path),
+# so switching databases (e.g. in tests) picks up a new engine while every
+# session for the same database shares one connection pool.
+_engines: Dict[str, Engine] = {}
 _engine_lock = threading.Lock()
 
+# SQLite allows one writer at a time. Bulk imports in this process take
+# turns on this lock instead of waiting in SQLite's sleep-and-retry busy
+# handler, which wakes late and gives up after the 30 s busy timeout
+# however long the other import still has to run.
+_bulk_write_lock = threading.Lock()
+
+
+def _create_engine_for(db_path: Path) -> Engine:
+    """Build a pooled engine for one SQLite file (or ":memory:")."""
+    url = f"sqlite:///{db_path}"
+
+    # Use more conservative settings for CI compatibility
+    connect_args = {
+        "check_same_thread": False,  # Allow multi-threading
+        "timeout": 30,  # SQLite busy timeout
+    }
+
+    # Detect CI environment and use simpler settings
+    is_ci = is_ci_environment()
+
+    if str(db_path) == ":memory:":
+        # Every new connection would otherwise see its own empty database
+        engine = create_engine(
+            url,
+            echo=False,
+            poolclass=StaticPool,
+            connect_args=connect_args
+        )
+    elif is_ci:
+        # Simpler configuration for CI environments
+        engine = create_engine(
+            url,
+            echo=False,
+            connect_args=connect_args
+        )
+    else:
+        # Enhanced connection settings for production
+        engine = create_engine(
+            url,
+            echo=False,
+            pool_size=10,  # Reduced for CI compatibility
+            max_overflow=20,  # Reduced for CI compatibility
+            pool_timeout=30,
+            pool_recycle=3600,
+            connect_args=connect_args
+        )
 
-def get_engine():
-    """Create (once) and return the SQLAlchemy engine bound to our SQLite DB.
+    event.listen(engine, "connect", _apply_pragmas)
+    if os.getenv(SQLITE_FAST_ENV_VAR) == "1":
+        event.listen(engine, "connect", _apply_fast_pragmas)
+    return engine
 
+
+def get_engine() -> Engine:
+    """Return the SQLAlchemy engine for the active database, creating it once.
+
+    One engine (and connection pool) is cached per W4GNS_DB_PATH value, so
+    changing the variable switches databases without any manual reset.
     Enhanced with connection pooling and thread safety.
     Raises RuntimeError if database creation fails.
     """
-    global _engine
-    if _engine is None:
+    key = os.getenv(DB_ENV_VAR) or ""
+    engine = _engines.get(key)
+    if engine is None:
         with _engine_lock:
             # Double-check locking pattern for thread safety
-            if _engine is None:
+            engine = _engines.get(key)
+            if engine is None:
                 try:
-                    db_path = get_db_path()
-                    url = f"sqlite:///{db_path}"
-
-                    # Use more conservative settings for CI compatibility
-                    connect_args = {
-                        "check_same_thread": False,  # Allow multi-threading
-                        "timeout": 30,  # SQLite busy timeout
-                    }
-
-                    # Detect CI environment and use simpler settings
-                    is_ci = any(
-                        env in os.environ
-                        for env in ['CI', 'GITHUB_ACTIONS', 'TRAVIS', 'JENKINS']
-                    )
-
-                    if is_ci:
-                        # Simpler configuration for CI environments
-                        _engine = create_engine(
-                            url,
-                            echo=False,
-                            connect_args=connect_args
-                        )
-                    else:
-                        # Enhanced connection settings for production
-                        _engine = create_engine(
-                            url,
-                            echo=False,
-                            pool_size=10,  # Reduced for CI compatibility
-                            max_overflow=20,  # Reduced for CI compatibility
-                            pool_timeout=30,
-                            pool_recycle=3600,
-                            connect_args=connect_args
-                        )
+                    engine = _create_engine_for(get_db_path())
                 except Exception as e:
                     raise RuntimeError(f"Failed to create database engine: {e}") from e
-    return _engine
+                _engines[key] = engine
+    return engine
+
+
+def reset_engine_cache() -> None:
+    """Dispose and forget every cached engine (mainly for tests)."""
+    with _engine_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+
+
+# Indexes older versions created that the composite (column, start_at) and
+# NOCASE call indexes make redundant; each one only slowed inserts down
+_OBSOLETE_INDEXES = ("ix_qso_band", "ix_qso_mode", "ix_qso_grid", "ix_qso_call")
 
 
 def create_db_and_tables() -> Path:
     """Create all tables for the current metadata if they don't exist yet.
 
+    Indexes added to the model after a database was first created are
+    created here too, and ones it no longer declares (_OBSOLETE_INDEXES) are
+    dropped, so existing logs match a new one on the next start.
+
     Raises RuntimeError if table creation fails.
     """
     try:
         engine = get_engine()
         SQLModel.metadata.create_all(engine)
+        with engine.begin() as conn:
+            for name in _OBSOLETE_INDEXES:
+                conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+        for index in QSO.__table__.indexes:
+            index.create(engine, checkfirst=True)
         return get_db_path()
     except Exception as e:
         raise RuntimeError(f"Failed to create database tables: {e}") from e
@@ -147,6 +254,12 @@ def add_qso(qso: QSO) -> QSO:
         raise RuntimeError(f"Failed to save QSO: {e}") from e
 
 
+# Ids per "WHERE id IN (...)" in get_qsos()/delete_qsos(): stays under
+# SQLite's bound-parameter limit (999 in builds before 3.32) however many
+# ids are passed
+_ID_BATCH_SIZE = 500
+
+
 def get_qso(qso_id: int) -> Optional[QSO]:
     """Fetch a QSO by primary key, or None if missing.
 
@@ -159,11 +272,63 @@ def get_qso(qso_id: int) -> Optional[QSO]:
         raise RuntimeError(f"Failed to retrieve QSO {qso_id}: {e}") from e
 
 
+def get_qsos(qso_ids: Iterable[int]) -> Dict[int, QSO]:
+    """Fetch many QSOs by primary key, returning them keyed by id.
+
+    Ids that do not exist are left out of the result. One session and one
+    query per _ID_BATCH_SIZE ids, instead of a session per id as with
+    repeated get_qso() calls.
+
+    Raises RuntimeError if database query fails.
+    """
+    try:
+        it = iter(qso_ids)
+        found: Dict[int, QSO] = {}
+        with session_scope() as session:
+            while batch := list(islice(it, _ID_BATCH_SIZE)):
+                for q in session.exec(select(QSO).where(QSO.id.in_(batch))):
+                    found[q.id] = q
+        return found
+    except Exception as e:
+        raise RuntimeError(f"Failed to retrieve QSOs: {e}") from e
+
+
+def count_qsos() -> int:
+    """Return the number of QSOs in the log with a single COUNT(*).
+
+    Raises RuntimeError if database query fails.
+    """
+    try:
+        with session_scope() as session:
+            return session.exec(select(func.count()).select_from(QSO)).one()
+    except Exception as e:
+        raise RuntimeError(f"Failed to count QSOs: {e}") from e
+
+
+def qso_log_stamp() -> Tuple[int, Optional[int]]:
+    """Return (QSO count, highest QSO id) in one query.
+
+    The pair changes when QSOs are added or deleted, from this process or
+    another one, so callers can key caches of derived data on it. One blind
+    spot: SQLite reuses the largest rowid, so deleting the newest QSO and
+    then adding one can reproduce the previous pair.
+
+    Raises RuntimeError if database query fails.
+    """
+    try:
+        with session_scope() as session:
+            count, max_id = session.exec(select(func.count(), func.max(QSO.id))).one()
+            return count, max_id
+    except Exception as e:
+        raise RuntimeError(f"Failed to read QSO log stamp: {e}") from e
+
+
 def get_first_qso_by_call(call: str) -> Optional[QSO]:
     """Find the first QSO matching a callsign (case-insensitive).
 
-    More efficient than search_qsos when you only need one result.
-    Uses next() to stop iteration immediately at first match.
+    More efficient than search_qsos when you only need one result: LIMIT 1
+    lets SQLite walk the start_at index newest-first and stop at the first
+    match instead of sorting every matching row.
 
     Args:
         call: Callsign to search for (substring match)
@@ -176,10 +341,8 @@ def get_first_qso_by_call(call: str) -> Optional[QSO]:
     """
     try:
         with session_scope() as session:
-            stmt = select(QSO).where(QSO.call.ilike(f"%{call}%")).order_by(
-                QSO.start_at.desc()
-            )
-            return next(session.exec(stmt), None)
+            stmt, params = _search_query(call, None, None, None, 1)
+            return session.exec(stmt, params=params).first()
     except Exception as e:
         raise RuntimeError(f"Failed to find QSO by call {call}: {e}") from e
 
@@ -187,9 +350,10 @@ def get_first_qso_by_call(call: str) -> Optional[QSO]:
 def find_qso_by_frequency(
     freq_mhz: float, tolerance: float = 0.001
 ) -> Optional[QSO]:
-    """Find first QSO near a given frequency.
+    """Find the most recent QSO near a given frequency.
 
-    Uses next() for efficient early termination at first match.
+    The tolerance window is an index range search on ix_qso_freq_mhz, and
+    LIMIT 1 means SQLite only keeps the newest candidate while sorting.
 
     Args:
         freq_mhz: Target frequency in MHz
@@ -209,12 +373,37 @@ def find_qso_by_frequency(
                     QSO.freq_mhz.between(freq_mhz - tolerance, freq_mhz + tolerance)
                 )
                 .order_by(QSO.start_at.desc())
+                .limit(1)
             )
-            return next(session.exec(stmt), None)
+            return session.exec(stmt).first()
     except Exception as e:
         raise RuntimeError(f"Failed to find QSO by frequency {freq_mhz}: {e}") from e
 
 
+@lru_cache(maxsize=None)
+def _recent_stmt(rows: bool, by_call: bool):
+    """Build the newest-first listing SELECT, with bound parameters.
+
+    Like _search_stmt(), each of the four variants (QSO objects or QSORow
+    columns, with or without a call filter) is built once, so repeated
+    listings skip rebuilding the statement; the call pattern and LIMIT are
+    supplied at execution time.
+    """
+    stmt = select(*_QSO_ROW_COLUMNS) if rows else select(QSO)
+    if by_call:
+        stmt = stmt.where(QSO.call.ilike(bindparam("call")))
+    stmt = stmt.order_by(QSO.start_at.desc()).limit(bindparam("limit", type_=Integer))
+    return stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+
+
+def _recent_query(rows: bool, limit: int, call: Optional[str]):
+    """Return the cached listing statement and its parameters."""
+    params: Dict[str, object] = {"limit": limit}
+    if call:
+        params["call"] = f"%{call}%"
+    return _recent_stmt(rows, bool(call)), params
+
+
 def list_qsos_stream(
     limit: int = 100, call: Optional[str] = None
 ) -> Iterator[QSO]:
@@ -234,16 +423,35 @@ def list_qsos_stream(
     """
     try:
         with session_scope() as session:
-            stmt = select(QSO)
-            if call:
-                stmt = stmt.where(QSO.call.ilike(f"%{call}%"))
-            stmt = stmt.order_by(QSO.start_at.desc()).limit(limit)
-            for qso in session.exec(stmt):
+            stmt, params = _recent_query(False, limit, call)
+            for qso in session.exec(stmt, params=params):
                 yield qso
     except Exception as e:
         raise RuntimeError(f"Failed to stream QSOs: {e}") from e
 
 
+def list_qso_rows_stream(
+    limit: int = 100, call: Optional[str] = None
+) -> Iterator[QSORow]:
+    """Stream recent QSOs as lightweight QSORow objects (generator).
+
+    Same rows and order as list_qsos_stream(), but selects plain columns
+    through SQLAlchemy Core instead of loading ORM objects, so there is no
+    Pydantic model, identity map, or per-instance __dict__ per row. Suited
+    to read-only bulk work such as ADIF export.
+
+    Raises:
+        RuntimeError if database query fails
+    """
+    try:
+        with session_scope() as session:
+            stmt, params = _recent_query(True, limit, call)
+            for row in session.execute(stmt, params):
+                yield QSORow(*row)
+    except Exception as e:
+        raise RuntimeError(f"Failed to stream QSO rows: {e}") from e
+
+
 def list_qsos(limit: int = 100, call: Optional[str] = None) -> List[QSO]:
     """Return recent QSOs, optionally filtering by callsign substring.
 
@@ -258,6 +466,104 @@ def list_qsos(limit: int = 100, call: Optional[str] = None) -> List[QSO]:
         raise RuntimeError(f"Failed to list QSOs: {e}") from e
 
 
+def list_qsos_filtered_stream(
+    limit: int = 100, band: Optional[str] = None, mode: Optional[str] = None
+) -> Iterator[QSO]:
+    """Stream the most recent `limit` QSOs that match band/mode (generator).
+
+    Equivalent to filtering list_qsos_stream(limit) with
+    awards.filtered_qsos_stream(), but the filter runs inside SQLite so
+    non-matching rows are never turned into QSO objects. Band and mode are
+    matched with the same normalization (str.strip() and str.upper()) as
+    the awards filters, so the results are identical.
+
+    Raises:
+        RuntimeError if database query fails
+    """
+    try:
+        with session_scope() as session:
+            stmt = _filtered_select(session, select(QSO), limit, band, mode)
+            for qso in session.exec(stmt.execution_options(yield_per=STREAM_BATCH_SIZE)):
+                yield qso
+    except Exception as e:
+        raise RuntimeError(f"Failed to stream filtered QSOs: {e}") from e
+
+
+# Below this limit a band/mode filter is driven from the recent rows: the
+# distinct spellings are read from just those rows, and the column's index
+# is kept out of the main query. Above it, a covering scan of the column's
+# index (about 5 ms per 100k QSOs) and an index search for the matches are
+# cheaper than sorting and probing that many recent ids.
+_RECENT_DRIVEN_MAX = 10000
+
+
+def _filtered_select(
+    session: Session, stmt, limit: int, band: Optional[str], mode: Optional[str]
+):
+    """Restrict `stmt` to the most recent `limit` QSOs matching band/mode, newest first.
+
+    SQLite's trim() only strips spaces and its upper() only folds ASCII, so
+    band and mode are not normalized in SQL. Instead each distinct raw value
+    (logs hold only a handful of spellings) is normalized with norm_value()
+    in Python, and the query keeps the rows whose raw value is one of the
+    matches.
+    """
+    recent = select(QSO.id).order_by(QSO.start_at.desc()).limit(limit)
+    stmt = stmt.where(QSO.id.in_(recent))
+    small = limit < _RECENT_DRIVEN_MAX
+    for column, wanted in ((QSO.band, band), (QSO.mode, mode)):
+        target = norm_value(wanted) if wanted else None
+        if target:
+            spellings = select(column).distinct()
+            if small:
+                spellings = spellings.where(QSO.id.in_(recent))
+            matches = [v for v in session.execute(spellings).scalars() if norm_value(v) == target]
+            # `column || ''` stops SQLite from walking the whole band/mode
+            # index when only a few recent rows are wanted
+            stmt = stmt.where((column.concat("") if small else column).in_(matches))
+    return stmt.order_by(QSO.start_at.desc())
+
+
+def list_qso_columns(
+    names: Sequence[str],
+    limit: int = 100,
+    band: Optional[str] = None,
+    mode: Optional[str] = None,
+) -> Dict[str, List[object]]:
+    """Return the listed qso columns for the QSOs list_qsos_filtered() would return.
+
+    The result is columnar: one list per name, all in the same row order.
+    Only those columns are selected through SQLAlchemy Core, so no QSO
+    objects are built; this is the cheap input for
+    awards.compute_summary_from_columns().
+
+    Raises RuntimeError if database query fails.
+    """
+    try:
+        columns = [QSO.__table__.c[name] for name in names]
+        with session_scope() as session:
+            stmt = _filtered_select(session, select(*columns), limit, band, mode)
+            rows = session.execute(stmt).all()
+        if not rows:
+            return {name: [] for name in names}
+        return dict(zip(names, map(list, zip(*rows))))
+    except Exception as e:
+        raise RuntimeError(f"Failed to list QSO columns: {e}") from e
+
+
+def list_qsos_filtered(
+    limit: int = 100, band: Optional[str] = None, mode: Optional[str] = None
+) -> List[QSO]:
+    """Return the recent QSOs matching band/mode, filtered in SQL.
+
+    Raises RuntimeError if database query fails.
+    """
+    try:
+        return list(list_qsos_filtered_stream(limit=limit, band=band, mode=mode))
+    except Exception as e:
+        raise RuntimeError(f"Failed to list filtered QSOs: {e}") from e
+
+
 def delete_qso(qso_id: int) -> bool:
     """Delete a QSO by id, returning True if it existed and was removed.
 
@@ -275,25 +581,155 @@ def delete_qso(qso_id: int) -> bool:
         raise RuntimeError(f"Failed to delete QSO {qso_id}: {e}") from e
 
 
+def delete_qsos(qso_ids: Iterable[int]) -> int:
+    """Delete QSOs by id in one transaction, returning how many were removed.
+
+    Ids that do not exist are ignored. One commit for the whole set instead
+    of one per QSO as with repeated delete_qso() calls.
+
+    Raises RuntimeError if database operation fails.
+    """
+    try:
+        it = iter(qso_ids)
+        removed = 0
+        with session_scope() as session:
+            while batch := list(islice(it, _ID_BATCH_SIZE)):
+                result = session.execute(delete(QSO).where(QSO.id.in_(batch)))
+                removed += result.rowcount
+            session.commit()
+            return removed
+    except Exception as e:
+        raise RuntimeError(f"Failed to delete QSOs: {e}") from e
+
+
+# qso table columns in QSORow field order, for Core selects of plain rows
+_QSO_ROW_COLUMNS = tuple(QSO.__table__.c[f.name] for f in fields(QSORow))
+
+# Insertable QSO columns (the id is left to SQLite), plus getters that read
+# all of them in one C call: from the instance __dict__ (where loaded
+# attribute values live) or, as a fallback, through the mapped attributes.
+_QSO_COLS = tuple(c.name for c in QSO.__table__.columns if c.name != "id")
+_qso_items = itemgetter(*_QSO_COLS)
+_qso_values = attrgetter(*_QSO_COLS)
+
+
+# Bulk inserts hand positional tuples straight to sqlite3's executemany,
+# skipping SQLAlchemy's per-row parameter processing. The columns' bind
+# processors (the DateTime one writes the "YYYY-MM-DD HH:MM:SS.ffffff" text
+# SQLAlchemy stores) are applied here instead, so bulk-inserted rows read
+# back exactly like ORM-inserted ones.
+_QSO_INSERT_SQL = (
+    f"INSERT INTO {QSO.__table__.name} ({', '.join(_QSO_COLS)}) "
+    f"VALUES ({', '.join('?' * len(_QSO_COLS))})"
+)
+_SQLITE_DIALECT = sqlite.dialect()
+
+
+def _fast_datetime_processor(proc):
+    """Wrap SQLAlchemy's SQLite DateTime bind processor with a fast path.
+
+    The stock processor %-formats a dict of fields for every value (about
+    1.7µs); for a naive datetime, isoformat(" ", "microseconds") yields the
+    same "YYYY-MM-DD HH:MM:SS.ffffff" text in a third of the time. Anything
+    else (None, aware datetimes, dates) goes to the stock processor.
+    """
+
+    def process(value):
+        if type(value) is datetime and value.tzinfo is None:
+            return value.isoformat(" ", "microseconds")
+        return proc(value)
+
+    return process
+
+
+def _bind_processor(column):
+    """Return the SQLite bind processor for a QSO column, or None if it needs none."""
+    proc = column.type.dialect_impl(_SQLITE_DIALECT).bind_processor(_SQLITE_DIALECT)
+    if proc is not None and isinstance(column.type, DateTime):
+        return _fast_datetime_processor(proc)
+    return proc
+
+
+_QSO_BIND_PROCESSORS = tuple(
+    (i, proc)
+    for i, name in enumerate(_QSO_COLS)
+    if (proc := _bind_processor(QSO.__table__.c[name])) is not None
+)
+
+
+def _qso_params(qsos: List[QSO]) -> List[Tuple[object, ...]]:
+    """Return positional INSERT parameters for `qsos`, in _QSO_COLS order.
+
+    Reads column values straight from each instance __dict__ instead of
+    calling model_dump(), which runs Pydantic's serializer for every row
+    (about 3x slower). Expired or unloaded instances lack some keys there
+    and go through attribute access, which loads them.
+    """
+    params: List[Tuple[object, ...]] = []
+    for q in qsos:
+        try:
+            params.append(_qso_items(q.__dict__))
+        except KeyError:
+            params.append(_qso_values(q))
+    if not params or not _QSO_BIND_PROCESSORS:
+        return params
+    # Apply the bind processors a column at a time: transpose the batch,
+    # map() each processed column, and zip the rows back together, instead
+    # of copying every row to a list and back to patch it
+    columns: List[Iterable[object]] = list(zip(*params))
+    for i, proc in _QSO_BIND_PROCESSORS:
+        columns[i] = map(proc, columns[i])
+    return list(zip(*columns))
+
+
+def _insert_qsos(session: Session, qsos: List[QSO]) -> None:
+    """Insert QSOs with one driver-level executemany of _QSO_INSERT_SQL.
+
+    Bypasses the ORM unit of work (no per-object flush or identity-map
+    bookkeeping) and Core's per-row parameter handling, so the rows go to
+    SQLite as one prepared statement with one tuple per QSO. Inserted
+    objects are not refreshed with ids.
+    """
+    if qsos:
+        session.connection().exec_driver_sql(_QSO_INSERT_SQL, _qso_params(qsos))
+
+
 def bulk_add_qsos(qsos: Iterable[QSO]) -> int:
     """Insert many QSOs at once, returning how many were provided.
 
+    All rows are written in a single transaction, one bulk import at a time
+    per process (see _bulk_write_lock). `qsos` is consumed in batches of
+    BULK_INSERT_BATCH_SIZE, so a generator (e.g. iter_adif() over an open
+    file) is inserted without ever being held in memory whole.
+
     Raises RuntimeError if bulk insert fails.
     """
     try:
-        items = list(qsos)
-        with session_scope() as session:
-            session.add_all(items)
+        it = iter(qsos)
+        count = 0
+        with _bulk_write_lock, session_scope() as session:
+            while batch := list(islice(it, BULK_INSERT_BATCH_SIZE)):
+                _insert_qsos(session, batch)
+                count += len(batch)
             session.commit()
-            return len(items)
+            return count
     except Exception as e:
         raise RuntimeError(f"Failed to bulk add QSOs: {e}") from e
 
 
 def bulk_add_qsos_parallel(qsos: Iterable[QSO], batch_size: int = 1000) -> int:
-    """Insert many QSOs using batched operations for better performance.
+    """Insert many QSOs, preparing batches on worker threads while one writer inserts.
 
-    Processes QSOs in batches to optimize database performance and memory usage.
+    Worker threads turn each batch of QSOs into INSERT parameters while the
+    calling thread, the only writer, executes the previous batch. All
+    batches are written in one BEGIN IMMEDIATE transaction: the write lock is
+    taken up front instead of on the first INSERT, so the import cannot fail
+    halfway with SQLITE_BUSY, and the whole import commits or rolls back as
+    a unit. Inputs under 200 QSOs go straight to bulk_add_qsos().
+
+    `qsos` is consumed lazily, one batch at a time, with at most one batch
+    per worker in flight, so a generator such as iter_adif() over an open
+    file is parsed and inserted without the whole log ever being in memory.
 
     Args:
         qsos: Iterable of QSO objects to insert
@@ -305,40 +741,136 @@ def bulk_add_qsos_parallel(qsos: Iterable[QSO], batch_size: int = 1000) -> int:
     Raises:
         RuntimeError if bulk insert fails
     """
+    it = iter(qsos)
+    head = list(islice(it, 200))
+    if len(head) < 200:
+        return bulk_add_qsos(head)
+
     try:
-        items = list(qsos)
-        total_inserted = 0
-
-        # Process in batches for better memory management and transaction handling
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
-            with session_scope() as session:
-                session.add_all(batch)
-                session.commit()
-                total_inserted += len(batch)
-
-        return total_inserted
+        source = chain(head, it)
+        batches = iter(lambda: list(islice(source, batch_size)), [])
+        workers = get_optimal_workers("mixed")
+        count = 0
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            with _bulk_write_lock, get_engine().connect() as conn:
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+                # Prepared batches are written in submission order; capping
+                # the queue keeps memory at a few batches however long the
+                # input is, while workers stay busy ahead of the writer
+                pending: Deque[concurrent.futures.Future] = deque()
+
+                def write_oldest() -> int:
+                    params = pending.popleft().result()
+                    conn.exec_driver_sql(_QSO_INSERT_SQL, params)
+                    return len(params)
+
+                for batch in batches:
+                    pending.append(executor.submit(_qso_params, batch))
+                    if len(pending) > workers:
+                        count += write_oldest()
+                while pending:
+                    count += write_oldest()
+                conn.commit()
+
+        return count
     except Exception as e:
         raise RuntimeError(f"Failed to bulk add QSOs: {e}") from e
 
 
+class CallMatch(str, Enum):
+    """How search_qsos() matches its `call` filter (always case-insensitive)."""
+
+    SUBSTRING = "substring"
+    PREFIX = "prefix"  # indexed (ix_qso_call_nocase)
+    EXACT = "exact"  # indexed (ix_qso_call_nocase)
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so `value` matches literally (ESCAPE '\\')."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@lru_cache(maxsize=None)
+def _search_stmt(filters: Tuple[str, ...]):
+    """Build the search SELECT for one combination of filters, with bound parameters.
+
+    There are only a few dozen combinations, so each statement is built once and
+    reused; values (including the LIMIT) are supplied at execution time.
+    """
+    stmt = select(QSO)
+    if "call" in filters:
+        stmt = stmt.where(QSO.call.ilike(bindparam("call")))
+    if "call_prefix" in filters:
+        # Plain LIKE (not lower(call) LIKE ...) so SQLite's LIKE
+        # optimization can range-scan ix_qso_call_nocase.
+        stmt = stmt.where(QSO.call.like(bindparam("call_prefix"), escape="\\"))
+    if "call_exact" in filters:
+        stmt = stmt.where(QSO.call.collate("NOCASE") == bindparam("call_exact"))
+    if "band" in filters:
+        stmt = stmt.where(QSO.band == bindparam("band"))
+    if "mode" in filters:
+        stmt = stmt.where(QSO.mode == bindparam("mode"))
+    if "grid" in filters:
+        stmt = stmt.where(QSO.grid == bindparam("grid"))
+    return stmt.order_by(QSO.start_at.desc()).limit(bindparam("limit", type_=Integer))
+
+
+def _search_query(
+    call: Optional[str],
+    band: Optional[str],
+    mode: Optional[str],
+    grid: Optional[str],
+    limit: int,
+    call_match: str = CallMatch.SUBSTRING,
+):
+    """Return the cached search statement and its parameters for these filters."""
+    params: Dict[str, object] = {}
+    if call:
+        try:
+            match = CallMatch(call_match)
+        except ValueError:
+            choices = ", ".join(repr(m.value) for m in CallMatch)
+            raise ValueError(f"call_match must be one of {choices}, not {call_match!r}") from None
+        if match is CallMatch.SUBSTRING:
+            params["call"] = f"%{call}%"
+        elif match is CallMatch.PREFIX:
+            # Typed % and _ are literal here, so a prefix stays a prefix
+            params["call_prefix"] = f"{_escape_like(call)}%"
+        else:
+            params["call_exact"] = call
+    if band:
+        params["band"] = band
+    if mode:
+        params["mode"] = mode
+    if grid:
+        params["grid"] = grid
+    stmt = _search_stmt(tuple(params))
+    params["limit"] = limit
+    return stmt, params
+
+
 def search_qsos_stream(
     call: Optional[str] = None,
     band: Optional[str] = None,
     mode: Optional[str] = None,
     grid: Optional[str] = None,
     limit: int = 100,
+    call_match: str = CallMatch.SUBSTRING,
 ) -> Iterator[QSO]:
     """Stream search results without loading all into memory (generator).
 
     Memory efficient for large result sets. Yields QSOs one at a time.
 
     Args:
-        call: Callsign substring filter (case-insensitive)
+        call: Callsign filter (case-insensitive)
         band: Exact band match
         mode: Exact mode match
         grid: Exact grid match
         limit: Maximum results to yield
+        call_match: How `call` matches: "substring" (default), "prefix" or
+            "exact". Prefix and exact use the ix_qso_call_nocase index;
+            substring has to scan every row.
 
     Yields:
         Matching QSO objects one at a time
@@ -348,17 +880,9 @@ def search_qsos_stream(
     """
     try:
         with session_scope() as session:
-            stmt = select(QSO)
-            if call:
-                stmt = stmt.where(QSO.call.ilike(f"%{call}%"))
-            if band:
-                stmt = stmt.where(QSO.band == band)
-            if mode:
-                stmt = stmt.where(QSO.mode == mode)
-            if grid:
-                stmt = stmt.where(QSO.grid == grid)
-            stmt = stmt.order_by(QSO.start_at.desc()).limit(limit)
-            for qso in session.exec(stmt):
+            stmt, params = _search_query(call, band, mode, grid, limit, call_match)
+            stmt = stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+            for qso in session.exec(stmt, params=params):
                 yield qso
     except Exception as e:
         raise RuntimeError(f"Failed to stream search results: {e}") from e
@@ -370,9 +894,11 @@ def search_qsos(
     mode: Optional[str] = None,
     grid: Optional[str] = None,
     limit: int = 100,
+    call_match: str = CallMatch.SUBSTRING,
 ) -> List[QSO]:
     """Flexible search across common fields; values must match exactly
-    except for `call`, which does a case-insensitive substring match.
+    except for `call`, which is case-insensitive and matched according to
+    `call_match` ("substring", "prefix" or "exact"; see search_qsos_stream()).
 
     For memory-efficient streaming, use search_qsos_stream() instead.
 
@@ -382,7 +908,12 @@ def search_qsos(
         # Use streaming internally for consistency
         return list(
             search_qsos_stream(
-                call=call, band=band, mode=mode, grid=grid, limit=limit
+                call=call,
+                band=band,
+                mode=mode,
+                grid=grid,
+                limit=limit,
+                call_match=call_match,
             )
         )
     except Exception as e:
@@ -396,18 +927,22 @@ def search_qsos_parallel(
     grid: Optional[str] = None,
     limit: int = 100,
     batch_size: int = 5000,
+    call_match: str = CallMatch.SUBSTRING,
 ) -> List[QSO]:
     """Enhanced search with optimized query execution for large datasets.
 
-    Uses batched processing for better performance on large result sets.
+    Runs the search once and fetches rows from the cursor `batch_size` at a
+    time (yield_per), rather than paging with OFFSET, which made SQLite
+    re-scan every skipped row for each later page.
 
     Args:
-        call: Callsign substring filter
+        call: Callsign filter (case-insensitive)
         band: Exact band match
         mode: Exact mode match
         grid: Exact grid match
         limit: Maximum results to return
-        batch_size: Internal batch size for processing
+        batch_size: Rows fetched and turned into QSOs per round trip
+        call_match: "substring" (default), "prefix" or "exact" call matching
 
     Returns:
         List of matching QSO objects
@@ -417,33 +952,8 @@ def search_qsos_parallel(
     """
     try:
         with session_scope() as session:
-            stmt = select(QSO)
-            if call:
-                stmt = stmt.where(QSO.call.ilike(f"%{call}%"))
-            if band:
-                stmt = stmt.where(QSO.band == band)
-            if mode:
-                stmt = stmt.where(QSO.mode == mode)
-            if grid:
-                stmt = stmt.where(QSO.grid == grid)
-            stmt = stmt.order_by(QSO.start_at.desc()).limit(limit)
-
-            # Use batch processing for large queries
-            if limit > batch_size:
-                results = []
-                offset = 0
-                while len(results) < limit:
-                    batch_stmt = stmt.offset(offset).limit(
-                        min(batch_size, limit - len(results))
-                    )
-                    batch_results = list(session.exec(batch_stmt))
-                    # Use next() to check if batch is empty (more Pythonic)
-                    if next(iter(batch_results), None) is None:
-                        break
-                    results.extend(batch_results)
-                    offset += batch_size
-                return results[:limit]
-            else:
-                return list(session.exec(stmt))
+            stmt, params = _search_query(call, band, mode, grid, limit, call_match)
+            stmt = stmt.execution_options(yield_per=batch_size)
+            return list(session.exec(stmt, params=params))
     except Exception as e:
         raise RuntimeError(f"Failed to search QSOs: {e}") from e